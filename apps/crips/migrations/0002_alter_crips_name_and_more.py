@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crips', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='crips',
+            name='name',
+            field=models.CharField(max_length=64, verbose_name='Crips type'),
+        ),
+        migrations.AddIndex(
+            model_name='crips',
+            index=models.Index(fields=['-created_at', '-id'], name='crips_crips_created_0bf530_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='crips',
+            index=models.Index(fields=['name'], name='crips_crips_name_4d3c4a_idx'),
+        ),
+    ]
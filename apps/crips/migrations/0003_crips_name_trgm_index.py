@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+TRGM_INDEX = 'crips_crips_name_trgm_idx'
+
+
+def create_trgm_index(apps, schema_editor):
+    """Add a trigram index for name ILIKE searches (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('crips', 'Crips')._meta.db_table
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {TRGM_INDEX} ON {table} USING gin (name gin_trgm_ops)'
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {TRGM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crips', '0002_alter_crips_name_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crips', '0003_crips_name_trgm_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='crips',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -7,11 +7,17 @@ from django.db import models
 class Crips(models.Model):
     id = models.AutoField(primary_key=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now_add=True)
-    name = models.CharField(max_length=255, verbose_name="Crips type")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    name = models.CharField(max_length=64, verbose_name="Crips type")
     qty = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Quantity")
     price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Selling Price")
     comment = models.TextField(null=True, blank=True, default=None, verbose_name="Additional Notes")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['name']),
+        ]
+
     def __str__(self):
         return f"{self.name}"
\ No newline at end of file
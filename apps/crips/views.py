@@ -1,22 +1,35 @@
 import logging
 import zoneinfo
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from django.urls import reverse
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_POST
 from django.http import JsonResponse, HttpRequest, HttpResponse
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Q, QuerySet, Sum
 from django.shortcuts import redirect, render
 from django.contrib.auth.decorators import login_required
+from django.utils import timezone
 from dateutil.parser import parse
 from decimal import Decimal
+from datetime import datetime
 
 from .models import Crips
-from utils.util_functions import admin_required, conv_timezone, filter_items, format_number
+from utils.util_functions import admin_required, conv_timezone, filter_query, format_number
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Immutable per-process values, resolved once instead of on every request
+_UTC = zoneinfo.ZoneInfo("UTC")
+
+
+@lru_cache(maxsize=None)
+def _crips_page_url() -> str:
+    """Resolve the crips page URL on first use and reuse it afterwards"""
+    return reverse('crips_page')
+
 
 # =============================================
 # CRIPS MANAGEMENT SERVICES
@@ -39,12 +52,13 @@ class CripsManagementService:
         try:
             crips_comment = post_data.get('comment', '').strip()
             
-            Crips.objects.create(
-                name=post_data.get('name', '').strip(),
-                qty=Decimal(post_data.get('qty', 0)),
-                price=Decimal(post_data.get('price', 0)),
-                comment=None if crips_comment == "" else crips_comment
-            )
+            with transaction.atomic():
+                Crips.objects.create(
+                    name=post_data.get('name', '').strip(),
+                    qty=Decimal(post_data.get('qty', 0)),
+                    price=Decimal(post_data.get('price', 0)),
+                    comment=None if crips_comment == "" else crips_comment
+                )
             
             logger.info("New crip created successfully")
             return {'success': True, 'sms': 'Operation completed successfully!'}
@@ -66,17 +80,19 @@ class CripsManagementService:
             Dict containing success status and message
         """
         try:
-            crip = CripsManagementService._get_crip(crip_id)
-            if not crip:
-                return {'success': False, 'sms': 'Crip not found.'}
-            
             crips_comment = post_data.get('comment', '').strip()
             
-            crip.name = post_data.get('name', '').strip()
-            crip.qty = Decimal(post_data.get('qty', 0))
-            crip.price = Decimal(post_data.get('price', 0))
-            crip.comment = None if crips_comment in ('N/A', "") else crips_comment
-            crip.save()
+            with transaction.atomic():
+                updated = Crips.objects.filter(id=crip_id).update(
+                    name=post_data.get('name', '').strip(),
+                    qty=Decimal(post_data.get('qty', 0)),
+                    price=Decimal(post_data.get('price', 0)),
+                    comment=None if crips_comment in ('N/A', "") else crips_comment,
+                    # update() bypasses save(), so auto_now has to be applied by hand
+                    updated_at=timezone.now()
+                )
+            if not updated:
+                return {'success': False, 'sms': 'Crip not found.'}
             
             logger.info(f"Crip {crip_id} updated successfully")
             return {
@@ -101,14 +117,13 @@ class CripsManagementService:
             Dict containing success status and redirect URL
         """
         try:
-            crip = CripsManagementService._get_crip(crip_id)
-            if not crip:
+            with transaction.atomic():
+                deleted, _ = Crips.objects.filter(id=crip_id).delete()
+            if not deleted:
                 return {'success': False, 'sms': 'Failed to delete crip.'}
             
-            crip.delete()
-            
             logger.info(f"Crip {crip_id} deleted successfully")
-            return {'success': True, 'url': reverse('crips_page')}
+            return {'success': True, 'url': _crips_page_url()}
             
         except Exception as e:
             logger.error(f"Error deleting crip {crip_id}: {str(e)}")
@@ -126,34 +141,28 @@ class CripsManagementService:
             Dict containing crip details or None if not found
         """
         try:
-            crip = CripsManagementService._get_crip(crip_id)
+            crip = Crips.objects.filter(id=crip_id).values(
+                'id', 'created_at', 'updated_at', 'name', 'price', 'qty', 'comment'
+            ).first()
             if not crip:
                 return None
             
             return {
-                'id': crip.id,
-                'regdate': conv_timezone(crip.created_at, '%d-%b-%Y %H:%M:%S'),
-                'updated': conv_timezone(crip.updated_at, '%d-%b-%Y %H:%M:%S'),
-                'name': crip.name,
-                'price': crip.price,
-                'qty': crip.qty,
-                'price_txt': format_number(crip.price),
-                'qty_txt': format_number(crip.qty),
-                'comment': crip.comment or 'N/A',
+                'id': crip['id'],
+                'regdate': conv_timezone(crip['created_at'], '%d-%b-%Y %H:%M:%S'),
+                'updated': conv_timezone(crip['updated_at'], '%d-%b-%Y %H:%M:%S'),
+                'name': crip['name'],
+                'price': crip['price'],
+                'qty': crip['qty'],
+                'price_txt': format_number(crip['price']),
+                'qty_txt': format_number(crip['qty']),
+                'comment': crip['comment'] or 'N/A',
                 'types': ['Ndizi', 'Viazi', 'Tambi']
             }
             
         except Exception as e:
             logger.error(f"Error getting crip details {crip_id}: {str(e)}")
             return None
-    
-    @staticmethod
-    def _get_crip(crip_id: int) -> Optional[Crips]:
-        """Get a crip by ID"""
-        try:
-            return Crips.objects.get(id=crip_id)
-        except Crips.DoesNotExist:
-            return None
 
 
 # =============================================
@@ -173,6 +182,16 @@ class CripsDataTablesService:
         5: 'amount',
     }
     
+    # Model fields backing each DataTable column
+    CRIPS_FIELD_MAPPING = {
+        'id': 'id',
+        'regdate': 'created_at',
+        'name': 'name',
+        'qty': 'qty',
+        'price': 'price',
+        'amount': 'amount',
+    }
+    
     # Filter types for specific columns
     COLUMN_FILTER_TYPES = {
         'qty': 'numeric',
@@ -180,6 +199,12 @@ class CripsDataTablesService:
         'amount': 'numeric',
     }
     
+    # Rows fetched per round-trip when streaming results
+    ITERATOR_CHUNK_SIZE = 2000
+    
+    # POST keys carrying per-column search values, built once at class load
+    COLUMN_SEARCH_KEYS = tuple(f'columns[{i}][search][value]' for i in CRIPS_COLUMN_MAPPING)
+    
     @staticmethod
     def parse_datatables_request(request: HttpRequest) -> Dict[str, Any]:
         """
@@ -191,17 +216,38 @@ class CripsDataTablesService:
         Returns:
             Dict containing parsed parameters
         """
+        get = request.POST.get
         return {
-            'draw': int(request.POST.get('draw', 0)),
-            'start': int(request.POST.get('start', 0)),
-            'length': int(request.POST.get('length', 10)),
-            'search_value': request.POST.get('search[value]', ''),
-            'order_column_index': int(request.POST.get('order[0][column]', 0)),
-            'order_dir': request.POST.get('order[0][dir]', 'asc'),
-            'start_date_str': request.POST.get('startdate'),
-            'end_date_str': request.POST.get('enddate'),
+            'draw': int(get('draw', 0)),
+            'start': int(get('start', 0)),
+            'length': int(get('length', 10)) or 10,
+            'search_value': get('search[value]', ''),
+            'order_column_index': int(get('order[0][column]', 0)),
+            'order_dir': get('order[0][dir]', 'asc'),
+            'start_date_str': get('startdate'),
+            'end_date_str': get('enddate'),
+            'last_created_at': get('last_created_at'),
+            'last_id': get('last_id'),
         }
     
+    @staticmethod
+    def parse_client_date(date_str: str) -> datetime:
+        """
+        Parse a date sent by the client into a UTC datetime
+        
+        Args:
+            date_str: Date string, normally ISO-8601 from toISOString()
+            
+        Returns:
+            Timezone-aware UTC datetime
+        """
+        try:
+            parsed = datetime.fromisoformat(date_str)
+        except ValueError:
+            # Fall back to the lenient parser for non-ISO input
+            parsed = parse(date_str)
+        return parsed.astimezone(_UTC)
+    
     @staticmethod
     def apply_date_filtering(queryset: QuerySet, start_date_str: str, end_date_str: str) -> QuerySet:
         """
@@ -220,10 +266,10 @@ class CripsDataTablesService:
             parsed_end_date = None
             
             if start_date_str:
-                parsed_start_date = parse(start_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_start_date = CripsDataTablesService.parse_client_date(start_date_str)
             
             if end_date_str:
-                parsed_end_date = parse(end_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_end_date = CripsDataTablesService.parse_client_date(end_date_str)
             
             if parsed_start_date and parsed_end_date:
                 return queryset.filter(created_at__range=(parsed_start_date, parsed_end_date))
@@ -237,112 +283,179 @@ class CripsDataTablesService:
         
         return queryset
     
+    @staticmethod
+    def annotate_amount(queryset: QuerySet) -> QuerySet:
+        """
+        Annotate each crip with its total amount (price * qty)
+        
+        Args:
+            queryset: Crips queryset
+            
+        Returns:
+            Queryset annotated with amount
+        """
+        return queryset.annotate(
+            amount=ExpressionWrapper(
+                F('price') * F('qty'), output_field=DecimalField(max_digits=20, decimal_places=4)
+            )
+        )
+    
     @staticmethod
     def prepare_crips_data(queryset: QuerySet) -> List[Dict[str, Any]]:
         """
         Convert crips queryset to list of dicts for DataTables
         
         Args:
-            queryset: Crips queryset
+            queryset: Crips queryset annotated with amount
             
         Returns:
             List of crips data dicts
         """
+        # Resolve the details URL prefix once instead of per row
+        details_url = reverse('crips_details', kwargs={'crip_id': 0}).rsplit('0/', 1)[0]
+        
         return [
             {
-                'id': item.id,
-                'regdate': item.created_at,
-                'name': item.name,
-                'qty': item.qty,
-                'price': item.price,
-                'amount': item.price * item.qty,
-                'info': reverse('crips_details', kwargs={'crip_id': int(item.id)})
+                'id': item['id'],
+                'regdate': item['created_at'],
+                'name': item['name'],
+                'qty': item['qty'],
+                'price': item['price'],
+                'amount': item['amount'],
+                'info': f"{details_url}{item['id']}/"
             }
-            for item in queryset
+            # Stream rows so "show all" (length=-1) doesn't also keep a queryset result cache
+            for item in queryset.values(
+                'id', 'created_at', 'name', 'qty', 'price', 'amount'
+            ).iterator(chunk_size=CripsDataTablesService.ITERATOR_CHUNK_SIZE)
         ]
     
     @staticmethod
-    def apply_sorting(data: List[Dict], order_column_index: int, order_dir: str) -> List[Dict]:
+    def apply_sorting(queryset: QuerySet, order_column_index: int, order_dir: str) -> QuerySet:
         """
-        Apply sorting to data list
+        Apply database ordering to queryset
         
         Args:
-            data: List of data dicts
+            queryset: Crips queryset
             order_column_index: Column index to sort by
             order_dir: Sort direction ('asc' or 'desc')
             
         Returns:
-            Sorted data list
+            Ordered queryset
         """
         order_column_name = CripsDataTablesService.CRIPS_COLUMN_MAPPING.get(order_column_index, 'regdate')
-        reverse_order = order_dir != 'asc'
+        order_field = CripsDataTablesService.CRIPS_FIELD_MAPPING[order_column_name]
+        
+        tiebreak = 'id'
+        if order_dir != 'asc':
+            order_field = f'-{order_field}'
+            tiebreak = '-id'
+        
+        if order_field.lstrip('-') == 'id':
+            return queryset.order_by(order_field)
         
-        return sorted(data, key=lambda x: x[order_column_name], reverse=reverse_order)
+        # Ties are broken by id so pages are deterministic and offset and keyset pages agree
+        return queryset.order_by(order_field, tiebreak)
     
     @staticmethod
-    def apply_column_filtering(data: List[Dict], request: HttpRequest) -> List[Dict]:
+    def apply_column_filtering(queryset: QuerySet, request: HttpRequest) -> QuerySet:
         """
         Apply individual column filtering
         
         Args:
-            data: List of data dicts
+            queryset: Crips queryset
             request: HTTP request object
             
         Returns:
-            Filtered data list
+            Filtered queryset
         """
-        filtered_data = data
-        
-        for i in range(len(CripsDataTablesService.CRIPS_COLUMN_MAPPING)):
-            column_search = request.POST.get(f'columns[{i}][search][value]', '')
+        post = request.POST
+        conditions = []
+        for search_key, column_field in zip(
+            CripsDataTablesService.COLUMN_SEARCH_KEYS, CripsDataTablesService.CRIPS_COLUMN_MAPPING.values()
+        ):
+            column_search = post.get(search_key)
             if column_search:
-                column_field = CripsDataTablesService.CRIPS_COLUMN_MAPPING.get(i)
-                if column_field:
-                    filter_type = CripsDataTablesService.COLUMN_FILTER_TYPES.get(column_field, 'contains')
-                    filtered_data = [
-                        item for item in filtered_data 
-                        if filter_items(column_field, column_search, item, filter_type)
-                    ]
-        
-        return filtered_data
+                filter_type = CripsDataTablesService.COLUMN_FILTER_TYPES.get(column_field, 'contains')
+                conditions.append(filter_query(
+                    CripsDataTablesService.CRIPS_FIELD_MAPPING[column_field], column_search, filter_type
+                ))
+        
+        if not conditions:
+            return queryset
+        
+        return queryset.filter(*conditions)
     
     @staticmethod
-    def apply_global_search(data: List[Dict], search_value: str) -> List[Dict]:
+    def apply_global_search(queryset: QuerySet, search_value: str) -> QuerySet:
         """
         Apply global search filtering
         
         Args:
-            data: List of data dicts
+            queryset: Crips queryset
             search_value: Search term
             
         Returns:
-            Filtered data list
+            Filtered queryset
         """
         if not search_value:
-            return data
+            return queryset
         
-        search_lower = search_value.lower()
-        return [
-            item for item in data 
-            if any(str(value).lower().find(search_lower) != -1 for value in item.values())
-        ]
+        return queryset.filter(
+            Q(name__icontains=search_value) | 
+            Q(qty__icontains=search_value) | 
+            Q(price__icontains=search_value)
+        )
     
     @staticmethod
-    def paginate_data(data: List[Dict], start: int, length: int) -> List[Dict]:
+    def paginate_data(queryset: QuerySet, start: int, length: int) -> QuerySet:
         """
-        Apply pagination to data
+        Apply pagination to queryset (LIMIT/OFFSET)
         
         Args:
-            data: List of data dicts
+            queryset: Crips queryset
             start: Start index
             length: Page length
             
         Returns:
-            Paginated data list
+            Paginated queryset
         """
         if length < 0:
-            return data
-        return data[start:start + length]
+            return queryset
+        return queryset[start:start + length]
+    
+    @staticmethod
+    def seek_page(queryset: QuerySet, params: Dict[str, Any]) -> Optional[QuerySet]:
+        """
+        Fetch the next page by seeking past the last row of the previous page
+        
+        Keyset pagination only applies to the default newest-first ordering,
+        where the client sends the created_at/id of the last row it received.
+        
+        Args:
+            queryset: Filtered crips queryset
+            params: Parsed DataTables parameters
+            
+        Returns:
+            Page queryset, or None when offset pagination must be used instead
+        """
+        if not (params['last_created_at'] and params['last_id']) or params['length'] < 0:
+            return None
+        if CripsDataTablesService.CRIPS_COLUMN_MAPPING.get(params['order_column_index']) != 'regdate':
+            return None
+        if params['order_dir'] == 'asc':
+            return None
+        
+        try:
+            last_created_at = datetime.fromisoformat(params['last_created_at'])
+            last_id = int(params['last_id'])
+        except ValueError:
+            return None
+        
+        return queryset.filter(
+            Q(created_at__lt=last_created_at) | 
+            Q(created_at=last_created_at, id__lt=last_id)
+        ).order_by('-created_at', '-id')[:params['length']]
     
     @staticmethod
     def format_final_data(data: List[Dict], start: int, length: int) -> List[Dict]:
@@ -375,17 +488,17 @@ class CripsDataTablesService:
         ]
     
     @staticmethod
-    def calculate_grand_total(data: List[Dict]) -> str:
+    def calculate_grand_total(queryset: QuerySet) -> str:
         """
-        Calculate grand total amount from data
+        Calculate grand total amount of the filtered crips from their annotated amount
         
         Args:
-            data: List of data dicts
+            queryset: Crips queryset annotated by annotate_amount
             
         Returns:
             Formatted grand total string
         """
-        grand_total_amount = sum(item['amount'] for item in data)
+        grand_total_amount = queryset.aggregate(total=Sum('amount'))['total'] or Decimal('0')
         return format_number(grand_total_amount) + " TZS"
 
 
@@ -455,31 +568,32 @@ def crips_page(request: HttpRequest) -> HttpResponse:
             queryset = CripsDataTablesService.apply_date_filtering(
                 queryset, params['start_date_str'], params['end_date_str']
             )
-            
-            # Prepare base data
-            base_data = CripsDataTablesService.prepare_crips_data(queryset)
-            total_records = len(base_data)
-            
-            # Apply sorting
-            base_data = CripsDataTablesService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir']
-            )
+            total_records = queryset.count()
+            unfiltered_queryset = queryset = CripsDataTablesService.annotate_amount(queryset)
             
             # Apply column filtering
-            base_data = CripsDataTablesService.apply_column_filtering(base_data, request)
+            queryset = CripsDataTablesService.apply_column_filtering(queryset, request)
             
             # Apply global search
-            base_data = CripsDataTablesService.apply_global_search(base_data, params['search_value'])
+            queryset = CripsDataTablesService.apply_global_search(queryset, params['search_value'])
             
-            # Calculate filtered record count and grand total
-            records_filtered = len(base_data)
-            grand_total = CripsDataTablesService.calculate_grand_total(base_data)
+            # Calculate filtered record count and grand total (no second COUNT when nothing was filtered)
+            records_filtered = total_records if queryset is unfiltered_queryset else queryset.count()
+            grand_total = CripsDataTablesService.calculate_grand_total(queryset)
             
-            # Apply pagination
-            paginated_data = CripsDataTablesService.paginate_data(
-                base_data, params['start'], params['length']
+            # Apply sorting
+            queryset = CripsDataTablesService.apply_sorting(
+                queryset, params['order_column_index'], params['order_dir']
             )
             
+            # Apply pagination (keyset seek when possible) and fetch only the current page
+            paginated_queryset = CripsDataTablesService.seek_page(queryset, params)
+            if paginated_queryset is None:
+                paginated_queryset = CripsDataTablesService.paginate_data(
+                    queryset, params['start'], params['length']
+                )
+            paginated_data = CripsDataTablesService.prepare_crips_data(paginated_queryset)
+            
             # Format final data
             final_data = CripsDataTablesService.format_final_data(
                 paginated_data, params['start'], params['length']
@@ -491,7 +605,11 @@ def crips_page(request: HttpRequest) -> HttpResponse:
                 'recordsTotal': total_records,
                 'recordsFiltered': records_filtered,
                 'data': final_data,
-                'grand_total': grand_total
+                'grand_total': grand_total,
+                'cursor': {
+                    'last_created_at': paginated_data[-1]['regdate'].isoformat(),
+                    'last_id': paginated_data[-1]['id'],
+                } if paginated_data else None
             }
             return JsonResponse(ajax_response)
             
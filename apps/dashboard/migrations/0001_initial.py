@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('shops', '0003_product_shops_produ_shop_id_5b43c7_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopDailySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Sales day (UTC)')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Total sales')),
+                ('total_profit', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Total profit')),
+                ('shop', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='shops.shop')),
+            ],
+            options={
+                'verbose_name': 'Shop daily sales',
+                'verbose_name_plural': 'Shop daily sales',
+                'constraints': [models.UniqueConstraint(fields=('shop', 'day'), name='unique_shop_daily_sales')],
+            },
+        ),
+    ]
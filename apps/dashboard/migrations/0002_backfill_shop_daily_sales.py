@@ -0,0 +1,39 @@
+from datetime import timezone
+
+from django.db import migrations
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_shop_daily_sales(apps, schema_editor):
+    """Build the daily rollup from existing sales"""
+    Sales = apps.get_model('shops', 'Sales')
+    ShopDailySales = apps.get_model('dashboard', 'ShopDailySales')
+
+    rows = Sales.objects.annotate(
+        day=TruncDate('created_at', tzinfo=timezone.utc)
+    ).values('shop_id', 'day').annotate(
+        total_amount=Sum('amount'),
+        total_profit=Sum('profit')
+    ).order_by()
+
+    ShopDailySales.objects.bulk_create(
+        [ShopDailySales(**row) for row in rows],
+        batch_size=1000
+    )
+
+
+def clear_shop_daily_sales(apps, schema_editor):
+    apps.get_model('dashboard', 'ShopDailySales').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('shops', '0003_product_shops_produ_shop_id_5b43c7_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_shop_daily_sales, clear_shop_daily_sales),
+    ]
@@ -1,3 +1,54 @@
+from datetime import datetime, time, timedelta, timezone
+
 from django.db import models
+from django.db.models import Count, Sum
+
+
+class ShopDailySalesManager(models.Manager):
+    def refresh(self, shop_id, day):
+        """Recompute one shop's totals for one (UTC) day from the Sales table"""
+        from apps.shops.models import Sales
+
+        day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+        totals = Sales.objects.filter(
+            shop_id=shop_id,
+            created_at__gte=day_start,
+            created_at__lt=day_start + timedelta(days=1)
+        ).aggregate(
+            sales_count=Count('id'),
+            total_amount=Sum('amount'),
+            total_profit=Sum('profit')
+        )
+
+        if not totals['sales_count']:
+            self.filter(shop_id=shop_id, day=day).delete()
+            return
+
+        self.update_or_create(
+            shop_id=shop_id,
+            day=day,
+            defaults={
+                'total_amount': totals['total_amount'],
+                'total_profit': totals['total_profit'],
+            }
+        )
+
+
+# Per-shop daily sales rollup, kept in sync with Sales by signals
+class ShopDailySales(models.Model):
+    shop = models.ForeignKey('shops.Shop', on_delete=models.CASCADE, related_name='daily_sales')
+    day = models.DateField(verbose_name="Sales day (UTC)")
+    total_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0, verbose_name="Total sales")
+    total_profit = models.DecimalField(max_digits=14, decimal_places=2, default=0, verbose_name="Total profit")
+
+    objects = ShopDailySalesManager()
+
+    class Meta:
+        verbose_name = "Shop daily sales"
+        verbose_name_plural = "Shop daily sales"
+        constraints = [
+            models.UniqueConstraint(fields=['shop', 'day'], name='unique_shop_daily_sales'),
+        ]
 
-# Create your models here.
+    def __str__(self):
+        return f"{self.shop_id} {self.day}"
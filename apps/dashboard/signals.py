@@ -0,0 +1,33 @@
+from datetime import timezone
+
+from django.db.models.signals import post_delete, post_save
+
+from apps.shops.models import Product, Sale_items, Sales, Shop
+from apps.users.models import CustomUser
+from .models import ShopDailySales
+
+
+# =============================================
+# DASHBOARD ROLLUP AND CACHE MAINTENANCE
+# =============================================
+
+def invalidate_dashboard_cache(sender, **kwargs):
+    """Drop cached dashboard contexts when data they summarise changes"""
+    from .views import DashboardCacheService
+    DashboardCacheService.invalidate()
+
+
+def refresh_shop_daily_sales(sender, instance, **kwargs):
+    """Recompute the daily rollup row a saved or deleted sale belongs to"""
+    ShopDailySales.objects.refresh(instance.shop_id, instance.created_at.astimezone(timezone.utc).date())
+
+
+def connect_signals():
+    """Connect rollup maintenance and cache invalidation to the models the dashboard reads"""
+    post_save.connect(refresh_shop_daily_sales, sender=Sales, dispatch_uid="dashboard_rollup_sales_save")
+    post_delete.connect(refresh_shop_daily_sales, sender=Sales, dispatch_uid="dashboard_rollup_sales_delete")
+    
+    for model in (Sales, Sale_items, Product, Shop, CustomUser):
+        uid = f"dashboard_cache_{model._meta.label_lower}"
+        post_save.connect(invalidate_dashboard_cache, sender=model, dispatch_uid=f"{uid}_save")
+        post_delete.connect(invalidate_dashboard_cache, sender=model, dispatch_uid=f"{uid}_delete")
@@ -1,35 +1,47 @@
 import logging
+import time
 from typing import Dict, Any, List
 from datetime import timedelta
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from collections import defaultdict
 
+from django.core.cache import cache
 from django.shortcuts import render
 from django.views.decorators.cache import never_cache
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q, Sum
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.timezone import localtime
 
-from apps.shops.models import Shop, Product, Sales, Sale_items
+from apps.shops.models import Shop, Sales, Sale_items
 from apps.users.models import CustomUser
 from utils.util_functions import format_number
+from .models import ShopDailySales
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_HUNDRED = Decimal('100')
+_ONE_DECIMAL_PLACE = Decimal('0.1')
+_CURRENCY_SCALES = ((1_000_000, 'M'), (1_000, 'k'))
+
 
 # =============================================
 # DASHBOARD SERVICES
 # =============================================
 
+# Query rule for this module: displayed numbers come from .count() or aggregate()
+# in SQL, and yes/no checks use .exists(). Never len(queryset) or bool(queryset),
+# which load every row just to measure it.
+
 class DashboardMetricsService:
     """Service class for calculating dashboard metrics"""
     
     @staticmethod
-    def get_current_and_previous_month() -> Dict[str, int]:
+    def get_current_and_previous_month(now=None) -> Dict[str, int]:
         """Get current and previous month/year values"""
-        now = timezone.now()
+        now = now or timezone.now()
         current_month = now.month
         current_year = now.year
         last_month = now.month - 1
@@ -50,37 +62,29 @@ class DashboardMetricsService:
     def get_sales_metrics(user, date_info: Dict[str, int]) -> Dict[str, Any]:
         """Calculate sales metrics for current and previous month"""
         try:
-            this_month_sales = Sales.objects.filter(
+            this_month = Q(
                 created_at__month=date_info['current_month'],
                 created_at__year=date_info['current_year']
             )
-            
-            last_month_sales = Sales.objects.filter(
+            last_month = Q(
                 created_at__month=date_info['last_month'],
                 created_at__year=date_info['last_year']
             )
             
-            # Apply user-specific filtering
-            if not user.is_admin:
-                this_month_sales = this_month_sales.filter(shop=user.shop)
-                last_month_sales = last_month_sales.filter(shop=user.shop)
-            
-            # Calculate totals
-            this_month_sales_total = this_month_sales.aggregate(
-                total=Sum('amount')
-            )['total'] or Decimal('0.00')
-            
-            last_month_sales_total = last_month_sales.aggregate(
-                total=Sum('amount')
-            )['total'] or Decimal('0.00')
-            
-            this_month_profit = this_month_sales.aggregate(
-                total=Sum('profit')
-            )['total'] or Decimal('0.00')
+            sales = Sales.objects.for_user(user).filter(this_month | last_month)
             
-            last_month_profit = last_month_sales.aggregate(
-                total=Sum('profit')
-            )['total'] or Decimal('0.00')
+            # Calculate all four totals in one scan with conditional aggregation
+            zero = Value(Decimal('0.00'))
+            totals = sales.aggregate(
+                this_month_sales_total=Coalesce(Sum('amount', filter=this_month), zero),
+                last_month_sales_total=Coalesce(Sum('amount', filter=last_month), zero),
+                this_month_profit=Coalesce(Sum('profit', filter=this_month), zero),
+                last_month_profit=Coalesce(Sum('profit', filter=last_month), zero)
+            )
+            this_month_sales_total = totals['this_month_sales_total']
+            last_month_sales_total = totals['last_month_sales_total']
+            this_month_profit = totals['this_month_profit']
+            last_month_profit = totals['last_month_profit']
             
             return {
                 'this_month_sales_total': this_month_sales_total,
@@ -96,7 +100,7 @@ class DashboardMetricsService:
             }
             
         except Exception as e:
-            logger.error(f"Error calculating sales metrics: {str(e)}")
+            logger.error("Error calculating sales metrics: %s", e)
             return {
                 'this_month_sales_total': Decimal('0.00'),
                 'last_month_sales_total': Decimal('0.00'),
@@ -107,65 +111,68 @@ class DashboardMetricsService:
             }
     
     @staticmethod
-    def get_user_metrics(user) -> Dict[str, int]:
+    def get_user_metrics(user, now=None) -> Dict[str, int]:
         """Calculate user activity metrics"""
         try:
-            now = timezone.now()
+            now = now or timezone.now()
             start_of_week = now - timedelta(days=now.weekday())
             start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
             
-            active_users = CustomUser.objects.filter(deleted=False, is_active=True).exclude(is_admin=True)
-            
-            if not user.is_admin:
-                active_users = active_users.filter(shop=user.shop)
+            active_users = CustomUser.objects.for_user(user).filter(
+                deleted=False, is_active=True
+            ).exclude(is_admin=True)
             
-            users_this_week = active_users.filter(last_login__gte=start_of_week, last_login__lte=now)
+            # Count active and this week's users in one query
+            counts = active_users.aggregate(
+                total=Count('id'),
+                weekly=Count('id', filter=Q(last_login__gte=start_of_week, last_login__lte=now))
+            )
             
             return {
-                'active_users': active_users.count(),
-                'weekly_users': users_this_week.count()
+                'active_users': counts['total'],
+                'weekly_users': counts['weekly']
             }
             
         except Exception as e:
-            logger.error(f"Error calculating user metrics: {str(e)}")
+            logger.error("Error calculating user metrics: %s", e)
             return {'active_users': 0, 'weekly_users': 0}
     
     @staticmethod
-    def get_inventory_metrics(user) -> Dict[str, Any]:
+    def get_inventory_metrics(user, now=None) -> Dict[str, Any]:
         """Calculate inventory and stock metrics"""
         try:
-            now = timezone.now()
-            low_stock_count = Product.objects.filter(is_deleted=False, qty__lt=5)
-            
-            if not user.is_admin:
-                low_stock_count = low_stock_count.filter(shop=user.shop)
-            
-            # Get stock distribution by shop
-            shops_list, stock_distribution = [], []
-            select_shops = Shop.objects.all()
-            
-            if not user.is_admin:
-                select_shops = select_shops.filter(id=user.shop_id)
-            
-            for shop in select_shops:
-                shops_list.append(shop.abbrev)
-                items_count = Product.objects.filter(
-                    is_hidden=False, 
-                    is_deleted=False, 
-                    shop=shop
-                ).filter(
-                    Q(expiry_date__isnull=True) | Q(expiry_date__gt=now.date())
-                )
-                stock_distribution.append(items_count.count())
+            now = now or timezone.now()
+            
+            # Count in-stock and low-stock products for every shop in one GROUP BY query
+            select_shops = Shop.objects.filter(Q() if user.is_admin else Q(id=user.shop_id))
+            
+            shop_counts = select_shops.annotate(
+                items=Count('products', filter=Q(
+                    products__is_hidden=False,
+                    products__is_deleted=False
+                ) & (
+                    Q(products__expiry_date__isnull=True) | Q(products__expiry_date__gt=now.date())
+                )),
+                low_stock=Count('products', filter=Q(
+                    products__is_deleted=False,
+                    products__qty__lt=5
+                ))
+            ).order_by('names').values_list('abbrev', 'items', 'low_stock')
+            
+            # Evaluate the per-shop rows once, then split them into columns
+            shops_list, stock_distribution, low_stock_per_shop = (
+                [list(column) for column in zip(*shop_counts)] or [[], [], []]
+            )
+            low_stock_count = sum(low_stock_per_shop)
             
             return {
-                'low_stock_count': low_stock_count.count(),
+                'low_stock_count': low_stock_count,
                 'stock_distribution': stock_distribution,
                 'stock_shops': shops_list
             }
             
         except Exception as e:
-            logger.error(f"Error calculating inventory metrics: {str(e)}")
+            logger.error("Error calculating inventory metrics: %s", e)
             return {
                 'low_stock_count': 0,
                 'stock_distribution': [],
@@ -177,76 +184,71 @@ class DashboardSalesService:
     """Service class for sales-related dashboard operations"""
     
     @staticmethod
-    def get_weekly_shop_sales(user) -> List[Dict[str, Any]]:
+    def get_weekly_shop_sales(user, now=None) -> List[Dict[str, Any]]:
         """Get weekly sales data for shops"""
         try:
-            today = timezone.now().date()
+            today = (now or timezone.now()).date()
             sales_data = []
             
             # Precompute the last 7 days (6 days ago, ..., yesterday, today)
             days = [today - timedelta(days=i) for i in reversed(range(7))]
             
-            # For optimization: Fetch all sales in the past 7 days
-            last_7_days = today - timedelta(days=6)
-            sales_qs = Sales.objects.filter(created_at__date__gte=last_7_days)
-            shops_qs = Shop.objects.all()
-            
+            # Read the pre-aggregated (UTC) daily rollup instead of scanning Sales
+            # Shop scoping is composed into each WHERE up front rather than chained on
+            day_filter = Q(day__gte=days[0], day__lte=days[-1])
+            shop_filter = Q()
             if not user.is_admin:
-                sales_qs = sales_qs.filter(shop=user.shop)
-                shops_qs = [user.shop]
+                day_filter &= Q(shop_id=user.shop_id)
+                shop_filter = Q(pk=user.shop_id)
+            
+            daily_totals = ShopDailySales.objects.filter(day_filter).values('shop__abbrev', 'day', 'total_amount')
+            shops_qs = Shop.objects.filter(shop_filter)
             
-            # Group by shop and by day
             grouped_sales = defaultdict(lambda: [0] * 7)
+            day_index = {day: index for index, day in enumerate(days)}
             
-            for sale in sales_qs:
-                shop_abbrev = sale.shop.abbrev
-                sale_date = sale.created_at.date()
-                if sale_date in days:
-                    index = days.index(sale_date)
-                    grouped_sales[shop_abbrev][index] += float(sale.amount)
+            for row in daily_totals:
+                grouped_sales[row['shop__abbrev']][day_index[row['day']]] = float(row['total_amount'])
             
             # Build final structured list
-            for shop in shops_qs:
+            for abbrev in shops_qs.values_list('abbrev', flat=True):
                 sales_data.append({
-                    "name": shop.abbrev,
-                    "data": grouped_sales[shop.abbrev]
+                    "name": abbrev,
+                    "data": grouped_sales[abbrev]
                 })
             
             return sales_data
             
         except Exception as e:
-            logger.error(f"Error getting weekly shop sales: {str(e)}")
+            logger.error("Error getting weekly shop sales: %s", e)
             return []
     
     @staticmethod
-    def get_recent_sales(user) -> List[Dict[str, Any]]:
+    def get_recent_sales(user, now=None) -> List[Dict[str, Any]]:
         """Get recent sales transactions"""
         try:
-            recent_sales = Sale_items.objects.all()
-            
-            if not user.is_admin:
-                recent_sales = recent_sales.filter(sale__shop=user.shop)
-            
-            recent_sales = recent_sales.order_by('-sale__created_at')[:9]
+            format_date = SaleDateFormatter(localtime(now or timezone.now()))
+            recent_sales = Sale_items.objects.for_user(user).order_by('-sale__created_at').values(
+                'qty', 'price', 'product__name', 'sale__shop__abbrev',
+                'sale__user__is_admin', 'sale__user__username', 'sale__created_at'
+            )[:9]
             recent_sales_list = []
-            count_sales = 1
             
-            for sales in recent_sales:
+            for count_sales, sales in enumerate(recent_sales, start=1):
                 recent_sales_list.append({
                     'count': count_sales,
-                    'product': sales.product.name,
-                    'qty': format_number(sales.qty),
-                    'amount': format_number(sales.qty * sales.price),
-                    'shop': sales.sale.shop.abbrev,
-                    'user': 'Admin' if sales.sale.user.is_admin else sales.sale.user.username,
-                    'date': DashboardUtilityService.format_sale_date(sales.sale.created_at)
+                    'product': sales['product__name'],
+                    'qty': format_number(sales['qty']),
+                    'amount': format_number(sales['qty'] * sales['price']),
+                    'shop': sales['sale__shop__abbrev'],
+                    'user': 'Admin' if sales['sale__user__is_admin'] else sales['sale__user__username'],
+                    'date': format_date(sales['sale__created_at'])
                 })
-                count_sales += 1
             
             return recent_sales_list
             
         except Exception as e:
-            logger.error(f"Error getting recent sales: {str(e)}")
+            logger.error("Error getting recent sales: %s", e)
             return []
 
 
@@ -256,94 +258,99 @@ class DashboardUtilityService:
     @staticmethod
     def percentage_change(current, previous):
         """Calculate percentage change between two values"""
-        try:
-            if previous == 0:
-                return "+100%" if current > 0 else "0.0%"
-            change = ((current - previous) / previous) * 100
-            return f"{change:+.1f}%"
-        except Exception as e:
-            logger.error(f"Error calculating percentage change: {str(e)}")
-            return "0.0%"
+        current = Decimal(current or 0)
+        previous = Decimal(previous or 0)
+        
+        if previous == 0:
+            return "+100%" if current > 0 else "0.0%"
+        
+        change = (current - previous) * _HUNDRED / previous
+        return f"{change.quantize(_ONE_DECIMAL_PLACE, rounding=ROUND_HALF_UP):+}%"
     
     @staticmethod
     def format_currency_display(amount):
         """Format currency amount for display"""
-        try:
-            if amount >= 1_000_000:
-                formatted = amount / 1_000_000
-                return f"{formatted:.2f}M"
-            elif amount >= 1_000:
-                formatted = amount / 1_000
-                return f"{formatted:.2f}k"
-            else:
-                return f"{amount:.2f}"
-        except Exception as e:
-            logger.error(f"Error formatting currency: {str(e)}")
-            return "0.00"
+        for threshold, suffix in _CURRENCY_SCALES:
+            if amount >= threshold:
+                return f"{amount / threshold:.2f}{suffix}"
+        return f"{amount:.2f}"
     
     @staticmethod
-    def format_sale_date(dt):
+    def format_sale_date(dt, now_local=None):
         """Format sale date for display"""
+        return SaleDateFormatter(now_local or localtime(timezone.now()))(dt)
+
+
+class SaleDateFormatter:
+    """Formats sale dates relative to a fixed moment, reusable across many rows"""
+    
+    def __init__(self, now_local):
+        self.today = now_local.date()
+        self.yesterday = self.today - timedelta(days=1)
+    
+    def __call__(self, dt) -> str:
         try:
             dt_local = localtime(dt)
-            now_local = localtime(timezone.now())
+            dt_date = dt_local.date()
             
-            today = now_local.date()
-            yesterday = today - timedelta(days=1)
-            
-            if dt_local.date() == today:
+            if dt_date == self.today:
                 return f"Today {dt_local.strftime('%H:%M')}"
-            elif dt_local.date() == yesterday:
+            elif dt_date == self.yesterday:
                 return f"Yesterday {dt_local.strftime('%H:%M')}"
             else:
                 return dt_local.strftime('%d-%b-%Y %H:%M')
         except Exception as e:
-            logger.error(f"Error formatting sale date: {str(e)}")
+            logger.error("Error formatting sale date: %s", e)
             return "Unknown"
 
 
+class DashboardCacheService:
+    """Service class for caching computed dashboard contexts"""
+    
+    CACHE_TIMEOUT = 60
+    VERSION_KEY = 'dashboard:version'
+    
+    @staticmethod
+    def get_version() -> int:
+        """Get the current cache version, starting a new one if missing"""
+        version = cache.get(DashboardCacheService.VERSION_KEY)
+        if version is None:
+            version = time.time_ns()
+            cache.set(DashboardCacheService.VERSION_KEY, version, None)
+        return version
+    
+    @staticmethod
+    def get_key(user) -> str:
+        """Build the cache key for a user's dashboard context"""
+        return (
+            f"dashboard:{DashboardCacheService.get_version()}:"
+            f"{user.id}:{user.shop_id}:{int(user.is_admin)}"
+        )
+    
+    @staticmethod
+    def invalidate():
+        """Invalidate all cached dashboard contexts by moving to a new version"""
+        cache.set(DashboardCacheService.VERSION_KEY, time.time_ns(), None)
+
+
 class DashboardDataService:
     """Service class for aggregating all dashboard data"""
     
     @staticmethod
     def get_dashboard_context(user) -> Dict[str, Any]:
-        """Get complete dashboard context data"""
+        """Get complete dashboard context data, served from cache when fresh"""
         try:
-            # Get date information
-            date_info = DashboardMetricsService.get_current_and_previous_month()
-            
-            # Get various metrics
-            sales_metrics = DashboardMetricsService.get_sales_metrics(user, date_info)
-            user_metrics = DashboardMetricsService.get_user_metrics(user)
-            inventory_metrics = DashboardMetricsService.get_inventory_metrics(user)
+            cache_key = DashboardCacheService.get_key(user)
+            context = cache.get(cache_key)
             
-            # Get sales data
-            weekly_sales_data = DashboardSalesService.get_weekly_shop_sales(user)
-            recent_sales_data = DashboardSalesService.get_recent_sales(user)
-            
-            # Build complete context
-            context = {
-                'total_sales': DashboardUtilityService.format_currency_display(
-                    float(sales_metrics['this_month_sales_total'])
-                ),
-                'sales_percent': sales_metrics['sales_percent'],
-                'total_profits': DashboardUtilityService.format_currency_display(
-                    float(sales_metrics['this_month_profit'])
-                ),
-                'profits_percent': sales_metrics['profits_percent'],
-                'low_stock_count': inventory_metrics['low_stock_count'],
-                'active_users': user_metrics['active_users'],
-                'weekly_users': user_metrics['weekly_users'],
-                'shops_sales_data': weekly_sales_data,
-                'stock_distribution': inventory_metrics['stock_distribution'],
-                'stock_shops': inventory_metrics['stock_shops'],
-                'recent_sales': recent_sales_data
-            }
+            if context is None:
+                context = DashboardDataService.build_dashboard_context(user)
+                cache.set(cache_key, context, DashboardCacheService.CACHE_TIMEOUT)
             
             return context
             
         except Exception as e:
-            logger.error(f"Error getting dashboard context: {str(e)}")
+            logger.error("Error getting dashboard context: %s", e)
             # Return safe default context
             return {
                 'total_sales': "0.00",
@@ -358,6 +365,43 @@ class DashboardDataService:
                 'stock_shops': [],
                 'recent_sales': []
             }
+    
+    @staticmethod
+    def build_dashboard_context(user) -> Dict[str, Any]:
+        """Compute complete dashboard context data from the database"""
+        # Resolve the clock once and share it across all services
+        now = timezone.now()
+        
+        # Get date information
+        date_info = DashboardMetricsService.get_current_and_previous_month(now)
+        
+        # Get various metrics
+        sales_metrics = DashboardMetricsService.get_sales_metrics(user, date_info)
+        user_metrics = DashboardMetricsService.get_user_metrics(user, now)
+        inventory_metrics = DashboardMetricsService.get_inventory_metrics(user, now)
+        
+        # Get sales data
+        weekly_sales_data = DashboardSalesService.get_weekly_shop_sales(user, now)
+        recent_sales_data = DashboardSalesService.get_recent_sales(user, now)
+        
+        # Build complete context
+        return {
+            'total_sales': DashboardUtilityService.format_currency_display(
+                float(sales_metrics['this_month_sales_total'])
+            ),
+            'sales_percent': sales_metrics['sales_percent'],
+            'total_profits': DashboardUtilityService.format_currency_display(
+                float(sales_metrics['this_month_profit'])
+            ),
+            'profits_percent': sales_metrics['profits_percent'],
+            'low_stock_count': inventory_metrics['low_stock_count'],
+            'active_users': user_metrics['active_users'],
+            'weekly_users': user_metrics['weekly_users'],
+            'shops_sales_data': weekly_sales_data,
+            'stock_distribution': inventory_metrics['stock_distribution'],
+            'stock_shops': inventory_metrics['stock_shops'],
+            'recent_sales': recent_sales_data
+        }
 
 
 # =============================================
@@ -380,11 +424,11 @@ def dashboard_page(request):
         # Get complete dashboard context using service
         context = DashboardDataService.get_dashboard_context(request.user)
         
-        logger.info(f"Dashboard loaded successfully for user {request.user.username}")
+        logger.info("Dashboard loaded successfully for user %s", request.user.username)
         return render(request, 'dashboard/dashboard.html', context)
         
     except Exception as e:
-        logger.error(f"Error loading dashboard for user {request.user.id}: {str(e)}")
+        logger.error("Error loading dashboard for user %s: %s", request.user.id, e)
         
         # Return dashboard with empty/safe default values
         safe_context = {
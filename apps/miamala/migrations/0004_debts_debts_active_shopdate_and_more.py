@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-15 23:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('miamala', '0003_debts_debts_active_bydate_debts_debts_active_byname_and_more'),
+        ('shops', '0003_product_shops_produ_shop_id_5b43c7_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='debts',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['shop', '-created_at', 'id'], name='debts_active_shopdate'),
+        ),
+        migrations.AddIndex(
+            model_name='expenses',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['shop', '-dates', 'id'], name='expenses_active_shopdate'),
+        ),
+        migrations.AddIndex(
+            model_name='lipanamba',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['shop', '-created_at', 'id'], name='lipa_active_shopdate'),
+        ),
+        migrations.AddIndex(
+            model_name='loans',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['shop', '-created_at', 'id'], name='loans_active_shopdate'),
+        ),
+        migrations.AddIndex(
+            model_name='selcompay',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['shop', '-created_at', 'id'], name='selcom_active_shopdate'),
+        ),
+    ]
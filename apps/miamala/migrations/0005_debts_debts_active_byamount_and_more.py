@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-15 23:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('miamala', '0004_debts_debts_active_shopdate_and_more'),
+        ('shops', '0003_product_shops_produ_shop_id_5b43c7_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='debts',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['amount', 'id'], name='debts_active_byamount'),
+        ),
+        migrations.AddIndex(
+            model_name='debts',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['paid', 'id'], name='debts_active_bypaid'),
+        ),
+        migrations.AddIndex(
+            model_name='lipanamba',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['amount', 'id'], name='lipa_active_byamount'),
+        ),
+        migrations.AddIndex(
+            model_name='loans',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['amount', 'id'], name='loans_active_byamount'),
+        ),
+        migrations.AddIndex(
+            model_name='loans',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['paid', 'id'], name='loans_active_bypaid'),
+        ),
+        migrations.AddIndex(
+            model_name='selcompay',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['amount', 'id'], name='selcom_active_byamount'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# (model, column, index name) searched with ILIKE by the DataTables global search
+TRGM_INDEXES = [
+    ('Selcompay', 'name', 'miamala_selcompay_name_trgm_idx'),
+    ('Lipanamba', 'name', 'miamala_lipanamba_name_trgm_idx'),
+    ('Debts', 'name', 'miamala_debts_name_trgm_idx'),
+    ('Loans', 'name', 'miamala_loans_name_trgm_idx'),
+    ('Expenses', 'title', 'miamala_expenses_title_trgm_idx'),
+]
+
+
+def create_trgm_indexes(apps, schema_editor):
+    """Add trigram indexes for name/title ILIKE searches (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for model_name, column, index_name in TRGM_INDEXES:
+        table = apps.get_model('miamala', model_name)._meta.db_table
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, _, index_name in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('miamala', '0005_debts_debts_active_byamount_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
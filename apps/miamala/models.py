@@ -13,6 +13,16 @@ class Selcompay(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.PROTECT, default=2, related_name='sel_user')
     shop = models.ForeignKey(Shop, on_delete=models.PROTECT, default=1, related_name='sel_shop')
 
+    class Meta:
+        # Partial indexes over live rows, matching the DataTables default ordering (overall and
+        # within one shop, as non-admin users see it) and the name and amount sorts
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], condition=models.Q(deleted=False), name='selcom_active_bydate'),
+            models.Index(fields=['shop', '-created_at', 'id'], condition=models.Q(deleted=False), name='selcom_active_shopdate'),
+            models.Index(fields=['name', 'id'], condition=models.Q(deleted=False), name='selcom_active_byname'),
+            models.Index(fields=['amount', 'id'], condition=models.Q(deleted=False), name='selcom_active_byamount'),
+        ]
+
     def __str__(self):
         return str(self.amount)
 
@@ -27,6 +37,16 @@ class Lipanamba(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.PROTECT, default=2, related_name='lipa_user')
     shop = models.ForeignKey(Shop, on_delete=models.PROTECT, default=1, related_name='lipa_shop')
 
+    class Meta:
+        # Partial indexes over live rows, matching the DataTables default ordering (overall and
+        # within one shop, as non-admin users see it) and the name and amount sorts
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], condition=models.Q(deleted=False), name='lipa_active_bydate'),
+            models.Index(fields=['shop', '-created_at', 'id'], condition=models.Q(deleted=False), name='lipa_active_shopdate'),
+            models.Index(fields=['name', 'id'], condition=models.Q(deleted=False), name='lipa_active_byname'),
+            models.Index(fields=['amount', 'id'], condition=models.Q(deleted=False), name='lipa_active_byamount'),
+        ]
+
     def __str__(self):
         return str(self.amount)
     
@@ -42,6 +62,17 @@ class Debts(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.PROTECT, default=2, related_name='debt_user')
     shop = models.ForeignKey(Shop, on_delete=models.PROTECT, default=1, related_name='debt_shop')
 
+    class Meta:
+        # Partial indexes over live rows, matching the DataTables default ordering (overall and
+        # within one shop, as non-admin users see it) and the name, amount and paid sorts
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], condition=models.Q(deleted=False), name='debts_active_bydate'),
+            models.Index(fields=['shop', '-created_at', 'id'], condition=models.Q(deleted=False), name='debts_active_shopdate'),
+            models.Index(fields=['name', 'id'], condition=models.Q(deleted=False), name='debts_active_byname'),
+            models.Index(fields=['amount', 'id'], condition=models.Q(deleted=False), name='debts_active_byamount'),
+            models.Index(fields=['paid', 'id'], condition=models.Q(deleted=False), name='debts_active_bypaid'),
+        ]
+
     def __str__(self):
         return str(self.name)
     
@@ -57,6 +88,17 @@ class Loans(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.PROTECT, default=2, related_name='loan_user')
     shop = models.ForeignKey(Shop, on_delete=models.PROTECT, default=1, related_name='loan_shop')
 
+    class Meta:
+        # Partial indexes over live rows, matching the DataTables default ordering (overall and
+        # within one shop, as non-admin users see it) and the name, amount and paid sorts
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], condition=models.Q(deleted=False), name='loans_active_bydate'),
+            models.Index(fields=['shop', '-created_at', 'id'], condition=models.Q(deleted=False), name='loans_active_shopdate'),
+            models.Index(fields=['name', 'id'], condition=models.Q(deleted=False), name='loans_active_byname'),
+            models.Index(fields=['amount', 'id'], condition=models.Q(deleted=False), name='loans_active_byamount'),
+            models.Index(fields=['paid', 'id'], condition=models.Q(deleted=False), name='loans_active_bypaid'),
+        ]
+
     def __str__(self):
         return str(self.name)
 
@@ -72,5 +114,14 @@ class Expenses(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.PROTECT, related_name='exp_user')
     shop = models.ForeignKey(Shop, on_delete=models.PROTECT, related_name='exp_shop')
 
+    class Meta:
+        # Partial indexes over live rows, matching the DataTables default ordering (overall and
+        # within one shop, as non-admin users see it) and the title sorts
+        indexes = [
+            models.Index(fields=['-dates', 'id'], condition=models.Q(deleted=False), name='expenses_active_bydate'),
+            models.Index(fields=['shop', '-dates', 'id'], condition=models.Q(deleted=False), name='expenses_active_shopdate'),
+            models.Index(fields=['title', 'id'], condition=models.Q(deleted=False), name='expenses_active_bytitle'),
+        ]
+
     def __str__(self):
         return str(self.title)
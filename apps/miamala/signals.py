@@ -0,0 +1,49 @@
+from django.db.models.signals import post_delete, post_save
+
+from apps.shops.models import Shop
+from apps.users.models import CustomUser
+from .models import Debts, Expenses, Lipanamba, Loans, Selcompay
+
+
+# =============================================
+# DATATABLES CACHE MAINTENANCE
+# =============================================
+
+CACHED_MODELS = (Selcompay, Lipanamba, Debts, Loans, Expenses)
+
+# Shop and user columns the cached rows display (shop abbrev, 'username (Admin)')
+DISPLAYED_FIELDS = {
+    Shop: {'abbrev'},
+    CustomUser: {'username', 'is_admin'},
+}
+
+
+def invalidate_record_cache(sender, **kwargs):
+    """Drop cached DataTables payloads of a record model saved outside the services"""
+    from .views import DataTablesCacheService
+    DataTablesCacheService.invalidate(sender)
+
+
+def invalidate_all_record_caches(sender, **kwargs):
+    """Drop every cached payload when a shop or user shown in the rows changes"""
+    # Partial saves of columns the rows never show (e.g. last_login on sign-in) keep the cache
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not DISPLAYED_FIELDS[sender] & set(update_fields):
+        return
+    
+    from .views import DataTablesCacheService
+    for model in CACHED_MODELS:
+        DataTablesCacheService.invalidate(model)
+
+
+def connect_signals():
+    """Connect DataTables cache invalidation to the models the miamala tables read"""
+    for model in CACHED_MODELS:
+        uid = f"miamala_cache_{model._meta.label_lower}"
+        post_save.connect(invalidate_record_cache, sender=model, dispatch_uid=f"{uid}_save")
+        post_delete.connect(invalidate_record_cache, sender=model, dispatch_uid=f"{uid}_delete")
+    
+    for model in (Shop, CustomUser):
+        uid = f"miamala_cache_{model._meta.label_lower}"
+        post_save.connect(invalidate_all_record_caches, sender=model, dispatch_uid=f"{uid}_save")
+        post_delete.connect(invalidate_all_record_caches, sender=model, dispatch_uid=f"{uid}_delete")
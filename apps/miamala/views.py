@@ -1,504 +1,541 @@
+import csv
+import hashlib
+import io
+import json
 import logging
+import re
+import time
 import zoneinfo
-from typing import Dict, Any, List
+from functools import lru_cache, reduce
+from operator import or_
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from django.shortcuts import render
 from django.views.decorators.cache import never_cache
 from django.contrib.auth.decorators import login_required
+import orjson
 from dateutil.parser import parse
-from django.http import JsonResponse, HttpRequest, HttpResponse
-from django.db.models import QuerySet, Q
+from django.core.cache import cache
+from django.http import JsonResponse, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.db import transaction
+from django.db.models import Case, CharField, Count, DecimalField, F, QuerySet, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, Concat
 from decimal import Decimal
 
-from datetime import datetime
+from datetime import date, datetime
 
 from .models import Selcompay, Lipanamba, Debts, Loans, Expenses
-from utils.util_functions import conv_timezone, filter_items, format_number, selcom_profit, lipa_profit
+from utils.util_functions import (
+    conv_timezone, filter_query, format_date, format_number, lipa_profit_expression, selcom_profit_expression
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_UTC = zoneinfo.ZoneInfo("UTC")
 
-# SELCOMPAY MANAGEMENT SERVICES
-class SelcomPayService:
-    """Service class for handling SelcomPay management operations"""
+# Shape of the plain dates posted by the expenses date inputs
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Rows fetched per round trip when streaming DataTables results
+ITERATOR_CHUNK_SIZE = 2000
+
+# Edits and soft deletes below are single QuerySet.update() statements: they skip
+# Model.save() and the pre_save/post_save signals, so any receiver added for these
+# models must be sent explicitly from the service method that performs the write.
+
+
+# BULK IMPORT UTILITIES
+@dataclass(slots=True, frozen=True)
+class RecordInput:
+    """Validated input for one name/amount record (SelcomPay, LipaNamba, debts, loans)"""
+    names: str
+    amount: Any
+    describe: Optional[str]
+    
+    @classmethod
+    def from_post(cls, data: Dict[str, Any]) -> Tuple[Optional['RecordInput'], Optional[str]]:
+        """Build an input from submitted form or CSV fields, or return the validation message"""
+        names = (data.get('names') or '').strip()
+        if len(names) < 3:
+            return None, 'Names must have atleast 3 characters.'
+        return cls(names, data.get('amount'), (data.get('describe') or '').strip() or None), None
+
+
+@dataclass(slots=True, frozen=True)
+class ExpenseInput:
+    """Validated input for one expense"""
+    dates: Any
+    title: str
+    amount: Any
+    describe: Optional[str]
+    
+    @classmethod
+    def from_post(cls, data: Dict[str, Any]) -> Tuple[Optional['ExpenseInput'], Optional[str]]:
+        """Build an input from submitted form or CSV fields, or return the validation message"""
+        title = (data.get('title') or '').strip()
+        if len(title) < 3:
+            return None, 'Title must have atleast 3 characters.'
+        return cls(data.get('dates'), title, data.get('amount'), (data.get('describe') or '').strip() or None), None
+
+
+class BulkImportService:
+    """Service class for reading and validating bulk record imports"""
+    
+    BATCH_SIZE = 1000
+    MAX_FILE_SIZE = 5 * 1024 * 1024
+    MAX_ROWS = 10000
     
     @staticmethod
-    def create_transaction(post_data: Dict[str, Any], user) -> Dict[str, Any]:
-        """Create a new SelcomPay transaction"""
+    def read_csv_rows(uploaded_file) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """Stream an uploaded CSV file into row dicts keyed by header, within the size and row limits"""
+        if uploaded_file.size > BulkImportService.MAX_FILE_SIZE:
+            max_mb = BulkImportService.MAX_FILE_SIZE // (1024 * 1024)
+            return [], f'The uploaded file is larger than {max_mb} MB.'
+        
+        text = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', newline='')
         try:
-            trans_names = post_data.get('names', '').strip()
-            trans_amount = post_data.get('amount')
-            trans_describe = post_data.get('describe', '').strip()
-            
-            if len(trans_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
-            
-            trans_describe = None if trans_describe == "" else trans_describe
-            
-            Selcompay.objects.create(
-                name=trans_names,
-                amount=trans_amount,
-                description=trans_describe,
-                user=user,
-                shop=user.shop
-            )
-            
-            logger.info("New SelcomPay transaction created successfully")
-            return {'success': True, 'sms': 'Transaction added successfully!'}
-            
-        except Exception as e:
-            logger.error(f"Error creating SelcomPay transaction: {str(e)}")
-            return {'success': False, 'sms': str(e)}
+            rows = []
+            for row in csv.DictReader(text):
+                if len(rows) == BulkImportService.MAX_ROWS:
+                    return [], f'Import at most {format_number(BulkImportService.MAX_ROWS)} rows per file.'
+                rows.append({(key or '').strip(): (value or '').strip() for key, value in row.items()})
+            return rows, None
+        finally:
+            # Leave the upload itself open for Django to clean up
+            text.detach()
     
     @staticmethod
-    def update_transaction(post_data: Dict[str, Any], trans_id: int, user) -> Dict[str, Any]:
-        """Update an existing SelcomPay transaction"""
-        try:
-            transaction = Selcompay.objects.get(id=trans_id)
-            trans_names = post_data.get('names', '').strip()
-            trans_amount = post_data.get('amount')
-            trans_describe = post_data.get('describe', '').strip()
-            
-            if len(trans_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
-            
-            trans_describe = None if trans_describe == "" else trans_describe
-            
-            if transaction.name != trans_names:
-                transaction.name = trans_names
-            if transaction.amount != trans_amount:
-                transaction.amount = trans_amount
-            if transaction.description != trans_describe:
-                transaction.description = trans_describe
-            if transaction.user != user:
-                transaction.user = user
-            if transaction.shop != user.shop:
-                transaction.shop = user.shop
-                
-            transaction.save()
-            
-            logger.info(f"SelcomPay transaction {trans_id} updated successfully")
-            return {'success': True, 'sms': 'Transaction updated successfully!'}
-            
-        except Selcompay.DoesNotExist:
-            return {'success': False, 'sms': 'Transaction not found.'}
-        except Exception as e:
-            logger.error(f"Error updating SelcomPay transaction {trans_id}: {str(e)}")
-            return {'success': False, 'sms': str(e)}
+    def parse_rows(rows: List[Dict[str, Any]], input_class) -> Tuple[List[Any], Optional[str]]:
+        """Validate every row into input_class instances, stopping at the first invalid row"""
+        inputs = []
+        for row_number, row in enumerate(rows, start=1):
+            item, error = input_class.from_post(row)
+            if error:
+                return [], BulkImportService.row_error(error, row_number, len(rows))
+            inputs.append(item)
+        return inputs, None
+    
+    @staticmethod
+    def row_error(sms: str, row_number: int, row_count: int) -> str:
+        """Prefix a validation message with its row number for multi-row imports"""
+        return sms if row_count == 1 else f'Row {row_number}: {sms}'
     
     @staticmethod
-    def delete_transaction(trans_id: int) -> Dict[str, Any]:
-        """Delete a SelcomPay transaction"""
+    def import_csv(request: HttpRequest, bulk_create) -> Dict[str, Any]:
+        """Create records from the uploaded 'import_file' CSV through a bulk service method"""
         try:
-            transaction = Selcompay.objects.get(id=trans_id)
-            transaction.deleted = 1
-            transaction.save()
-            
-            logger.info(f"SelcomPay transaction {trans_id} deleted successfully")
-            return {'success': True, 'sms': 'Transaction deleted successfully!'}
-            
-        except Selcompay.DoesNotExist:
-            return {'success': False, 'sms': 'Transaction not found.'}
-        except Exception as e:
-            logger.error(f"Error deleting SelcomPay transaction {trans_id}: {str(e)}")
-            return {'success': False, 'sms': str(e)}
+            rows, error = BulkImportService.read_csv_rows(request.FILES['import_file'])
+        except (UnicodeDecodeError, csv.Error) as e:
+            logger.error(f"Error reading import file: {str(e)}")
+            return {'success': False, 'sms': 'Could not read the uploaded CSV file.'}
+        
+        if error:
+            return {'success': False, 'sms': error}
+        
+        if not rows:
+            return {'success': False, 'sms': 'The uploaded file has no rows.'}
+        
+        return bulk_create(rows, request.user)
 
 
-# LIPANAMBA MANAGEMENT SERVICES
-class LipaNambaService:
-    """Service class for handling LipaNamba management operations"""
+# RECORD MANAGEMENT BASE SERVICE
+class RecordService:
+    """Shared create/update/delete operations for soft-deletable miamala records"""
     
-    @staticmethod
-    def create_transaction(post_data: Dict[str, Any], user) -> Dict[str, Any]:
-        """Create a new LipaNamba transaction"""
-        try:
-            trans_names = post_data.get('names', '').strip()
-            trans_amount = post_data.get('amount')
-            trans_describe = post_data.get('describe', '').strip()
-            
-            if len(trans_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
-            
-            trans_describe = None if trans_describe == "" else trans_describe
-            
-            Lipanamba.objects.create(
-                name=trans_names,
-                amount=trans_amount,
-                description=trans_describe,
-                user=user,
-                shop=user.shop
-            )
-            
-            logger.info("New LipaNamba transaction created successfully")
-            return {'success': True, 'sms': 'Transaction added successfully!'}
-            
-        except Exception as e:
-            logger.error(f"Error creating LipaNamba transaction: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed'}
+    model = None
+    input_class = RecordInput
+    log_label = ''
+    noun = ''
+    plural = ''
+    created_sms = ''
+    updated_sms = ''
+    failed_sms = None
+    touch_created_at = False
+    update_key = ''
+    delete_key = 'delete_id'
+    delete_many_key = 'delete_ids[]'
     
-    @staticmethod
-    def update_transaction(post_data: Dict[str, Any], trans_id: int, user) -> Dict[str, Any]:
-        """Update an existing LipaNamba transaction"""
+    @classmethod
+    def handle_actions(cls, request: HttpRequest) -> Dict[str, Any]:
+        """Route an actions POST (import, bulk delete, delete, update, create) to its operation"""
+        if request.method != 'POST':
+            return {'success': False, 'sms': 'Unknown error'}
+        
         try:
-            transaction = Lipanamba.objects.get(id=trans_id)
-            trans_names = post_data.get('names', '').strip()
-            trans_amount = post_data.get('amount')
-            trans_describe = post_data.get('describe', '').strip()
-            
-            if len(trans_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
-            
-            trans_describe = None if trans_describe == "" else trans_describe
-            
-            if transaction.name != trans_names:
-                transaction.name = trans_names
-            if transaction.amount != trans_amount:
-                transaction.amount = trans_amount
-            if transaction.description != trans_describe:
-                transaction.description = trans_describe
-            if transaction.user != user:
-                transaction.user = user
-            if transaction.shop != user.shop:
-                transaction.shop = user.shop
-                
-            transaction.save()
-            
-            logger.info(f"LipaNamba transaction {trans_id} updated successfully")
-            return {'success': True, 'sms': 'Transaction updated successfully!'}
+            post_data = request.POST
+            record_id = post_data.get(cls.update_key)
+            delete_id = post_data.get(cls.delete_key)
+            delete_ids = post_data.getlist(cls.delete_many_key)
+            
+            if 'import_file' in request.FILES:
+                return BulkImportService.import_csv(request, cls.create_bulk)
+            if delete_ids:
+                return cls.delete_many(delete_ids)
+            if delete_id:
+                return cls.delete(delete_id)
+            if record_id:
+                return cls.update(post_data, record_id, request.user)
+            return cls.create(post_data, request.user)
             
-        except Lipanamba.DoesNotExist:
-            return {'success': False, 'sms': 'Transaction not found.'}
         except Exception as e:
-            logger.error(f"Error updating LipaNamba transaction {trans_id}: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed'}
+            logger.error(f"Error in {cls.log_label} actions: {str(e)}")
+            return cls.failure(e)
     
-    @staticmethod
-    def delete_transaction(trans_id: int) -> Dict[str, Any]:
-        """Delete a LipaNamba transaction"""
+    @classmethod
+    def failure(cls, e: Exception) -> Dict[str, Any]:
+        """Response for an unexpected error; services without failed_sms report the error itself"""
+        return {'success': False, 'sms': cls.failed_sms or str(e)}
+    
+    @classmethod
+    def build_record(cls, item: RecordInput, user):
+        """Build an unsaved model instance from a validated input"""
+        return cls.model(name=item.names, amount=item.amount, description=item.describe, user=user, shop=user.shop)
+    
+    @classmethod
+    def update_changes(cls, post_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Field values an edit writes, or the validation message"""
+        item, error = cls.input_class.from_post(post_data)
+        if error:
+            return {}, error
+        return {'name': item.names, 'amount': item.amount, 'description': item.describe}, None
+    
+    @classmethod
+    def create(cls, post_data: Dict[str, Any], user) -> Dict[str, Any]:
+        """Create a single record"""
+        result = cls.create_bulk([post_data], user)
+        if result['success']:
+            return {'success': True, 'sms': cls.created_sms}
+        return result
+    
+    @classmethod
+    def create_bulk(cls, rows: List[Dict[str, Any]], user) -> Dict[str, Any]:
+        """Create several records with batched inserts"""
         try:
-            transaction = Lipanamba.objects.get(id=trans_id)
-            transaction.deleted = 1
-            transaction.save()
+            inputs, error = BulkImportService.parse_rows(rows, cls.input_class)
+            if error:
+                return {'success': False, 'sms': error}
             
-            logger.info(f"LipaNamba transaction {trans_id} deleted successfully")
-            return {'success': True, 'sms': 'Transaction deleted successfully!'}
+            records = [cls.build_record(item, user) for item in inputs]
+            with transaction.atomic():
+                cls.model.objects.bulk_create(records, batch_size=BulkImportService.BATCH_SIZE)
+            DataTablesCacheService.invalidate(cls.model)
+            
+            logger.info(f"{len(records)} new {cls.log_label}s created successfully")
+            return {'success': True, 'sms': f'{len(records)} {cls.plural} added successfully!', 'created': len(records)}
             
-        except Lipanamba.DoesNotExist:
-            return {'success': False, 'sms': 'Transaction not found.'}
         except Exception as e:
-            logger.error(f"Error deleting LipaNamba transaction {trans_id}: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed'}
-
-
-# DEBTS MANAGEMENT SERVICES
-class DebtsService:
-    """Service class for handling Debts management operations"""
+            logger.error(f"Error creating {cls.log_label}s: {str(e)}")
+            return cls.failure(e)
     
-    @staticmethod
-    def create_debt(post_data: Dict[str, Any], user) -> Dict[str, Any]:
-        """Create a new debt"""
+    @classmethod
+    def update(cls, post_data: Dict[str, Any], record_id: int, user) -> Dict[str, Any]:
+        """Update a record in one statement, skipping the write when nothing changed"""
         try:
-            debt_names = post_data.get('names', '').strip()
-            debt_amount = post_data.get('amount')
-            debt_describe = post_data.get('describe', '').strip()
-            
-            if len(debt_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
+            changes, error = cls.update_changes(post_data)
+            if error:
+                return {'success': False, 'sms': error}
+            changes.update(user=user, shop=user.shop)
+            touch = {'created_at': timezone.now()} if cls.touch_created_at else {}
             
-            debt_describe = None if debt_describe == "" else debt_describe
+            # Rows already holding the submitted values are excluded, so a no-op edit writes nothing
+            rows = cls.model.objects.filter(id=record_id)
+            if not rows.exclude(**changes).update(**changes, **touch) and not rows.exists():
+                return {'success': False, 'sms': f'{cls.noun} not found.'}
+            DataTablesCacheService.invalidate(cls.model)
             
-            Debts.objects.create(
-                name=debt_names,
-                amount=debt_amount,
-                description=debt_describe,
-                user=user,
-                shop=user.shop
-            )
-            
-            logger.info("New debt created successfully")
-            return {'success': True, 'sms': 'New debt added successfully!'}
+            logger.info(f"{cls.log_label} {record_id} updated successfully")
+            return {'success': True, 'sms': cls.updated_sms}
             
         except Exception as e:
-            logger.error(f"Error creating debt: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed..!'}
+            logger.error(f"Error updating {cls.log_label} {record_id}: {str(e)}")
+            return cls.failure(e)
     
-    @staticmethod
-    def update_debt(post_data: Dict[str, Any], debt_id: int, user) -> Dict[str, Any]:
-        """Update an existing debt"""
+    @classmethod
+    def delete(cls, record_id: int) -> Dict[str, Any]:
+        """Soft-delete a record"""
         try:
-            debt = Debts.objects.get(id=debt_id)
-            debt_names = post_data.get('names', '').strip()
-            debt_paid = post_data.get('paid')
-            debt_describe = post_data.get('describe', '').strip()
+            if not cls.model.objects.filter(id=record_id).exclude(deleted=True).update(deleted=True):
+                return {'success': False, 'sms': f'{cls.noun} not found.'}
+            DataTablesCacheService.invalidate(cls.model)
             
-            if len(debt_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
+            logger.info(f"{cls.log_label} {record_id} deleted successfully")
+            return {'success': True, 'sms': f'{cls.noun} deleted successfully!'}
             
-            if debt_paid:
-                debt_paid = Decimal(debt_paid)
-                if debt_paid < 0.0:
-                    debt.paid = debt.paid + abs(debt_paid)
-                else:
-                    debt.amount = debt.amount + debt_paid
-            
-            debt_describe = None if debt_describe == "" else debt_describe
-            
-            if debt.name != debt_names:
-                debt.name = debt_names
-            if debt.description != debt_describe:
-                debt.description = debt_describe
-            if debt.user != user:
-                debt.user = user
-            if debt.shop != user.shop:
-                debt.shop = user.shop
-                
-            debt.save()
-            
-            logger.info(f"Debt {debt_id} updated successfully")
-            return {'success': True, 'sms': 'Debt details updated successfully!'}
-            
-        except Debts.DoesNotExist:
-            return {'success': False, 'sms': 'Debt not found.'}
         except Exception as e:
-            logger.error(f"Error updating debt {debt_id}: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed..!'}
+            logger.error(f"Error deleting {cls.log_label} {record_id}: {str(e)}")
+            return cls.failure(e)
     
-    @staticmethod
-    def delete_debt(debt_id: int) -> Dict[str, Any]:
-        """Delete a debt"""
+    @classmethod
+    def delete_many(cls, ids: List[int]) -> Dict[str, Any]:
+        """Soft-delete several records with a single update"""
         try:
-            debt = Debts.objects.get(id=debt_id)
-            debt.deleted = 1
-            debt.save()
+            updated = cls.model.objects.filter(id__in=ids).exclude(deleted=True).update(deleted=True)
+            if not updated:
+                return {'success': False, 'sms': f'No {cls.plural} found.'}
+            DataTablesCacheService.invalidate(cls.model)
             
-            logger.info(f"Debt {debt_id} deleted successfully")
-            return {'success': True, 'sms': 'Debt deleted successfully!'}
+            logger.info(f"{updated} {cls.log_label}s deleted successfully")
+            return {'success': True, 'sms': f'{updated} {cls.plural} deleted successfully!'}
             
-        except Debts.DoesNotExist:
-            return {'success': False, 'sms': 'Debt not found.'}
         except Exception as e:
-            logger.error(f"Error deleting debt {debt_id}: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed..!'}
+            logger.error(f"Error deleting {cls.log_label}s: {str(e)}")
+            return cls.failure(e)
 
 
-# LOANS MANAGEMENT SERVICES
-class LoansService:
-    """Service class for handling Loans management operations"""
+# SELCOMPAY MANAGEMENT SERVICES
+class SelcomPayService(RecordService):
+    """Service class for handling SelcomPay management operations"""
     
-    @staticmethod
-    def create_loan(post_data: Dict[str, Any], user) -> Dict[str, Any]:
-        """Create a new loan"""
-        try:
-            loan_names = post_data.get('names', '').strip()
-            loan_amount = post_data.get('amount')
-            loan_describe = post_data.get('describe', '').strip()
-            
-            if len(loan_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
-            
-            loan_describe = None if loan_describe == "" else loan_describe
-            
-            Loans.objects.create(
-                name=loan_names,
-                amount=loan_amount,
-                description=loan_describe,
-                user=user,
-                shop=user.shop
-            )
-            
-            logger.info("New loan created successfully")
-            return {'success': True, 'sms': 'New loan added successfully!'}
-            
-        except Exception as e:
-            logger.error(f"Error creating loan: {str(e)}")
-            return {'success': False, 'sms': str(e)}
+    model = Selcompay
+    log_label = 'SelcomPay transaction'
+    noun = 'Transaction'
+    plural = 'transactions'
+    created_sms = 'Transaction added successfully!'
+    updated_sms = 'Transaction updated successfully!'
+    update_key = 'transact_id'
+
+
+# LIPANAMBA MANAGEMENT SERVICES
+class LipaNambaService(RecordService):
+    """Service class for handling LipaNamba management operations"""
     
-    @staticmethod
-    def update_loan(post_data: Dict[str, Any], loan_id: int, user) -> Dict[str, Any]:
-        """Update an existing loan"""
-        try:
-            loan = Loans.objects.get(id=loan_id)
-            loan_names = post_data.get('names', '').strip()
-            loan_paid = post_data.get('paid')
-            loan_describe = post_data.get('describe', '').strip()
-            
-            if len(loan_names) < 3:
-                return {'success': False, 'sms': 'Names must have atleast 3 characters.'}
-            
-            if loan_paid:
-                loan_paid = Decimal(loan_paid)
-                if loan_paid < 0.0:
-                    loan.paid = loan.paid + abs(loan_paid)
-                else:
-                    loan.amount = loan.amount + loan_paid
-            
-            loan_describe = None if loan_describe == "" else loan_describe
-            
-            if loan.name != loan_names:
-                loan.name = loan_names
-            if loan.description != loan_describe:
-                loan.description = loan_describe
-            if loan.user != user:
-                loan.user = user
-            if loan.shop != user.shop:
-                loan.shop = user.shop
-                
-            loan.save()
-            
-            logger.info(f"Loan {loan_id} updated successfully")
-            return {'success': True, 'sms': 'Loan details updated successfully!'}
-            
-        except Loans.DoesNotExist:
-            return {'success': False, 'sms': 'Loan not found.'}
-        except Exception as e:
-            logger.error(f"Error updating loan {loan_id}: {str(e)}")
-            return {'success': False, 'sms': str(e)}
+    model = Lipanamba
+    log_label = 'LipaNamba transaction'
+    noun = 'Transaction'
+    plural = 'transactions'
+    created_sms = 'Transaction added successfully!'
+    updated_sms = 'Transaction updated successfully!'
+    failed_sms = 'Operation failed'
+    touch_created_at = True
+    update_key = 'transact_id'
+
+
+# DEBTS AND LOANS MANAGEMENT SERVICES
+class BalanceRecordService(RecordService):
+    """Shared edit rules for records that track an amount owed and the amount paid"""
     
-    @staticmethod
-    def delete_loan(loan_id: int) -> Dict[str, Any]:
-        """Delete a loan"""
-        try:
-            loan = Loans.objects.get(id=loan_id)
-            loan.deleted = 1
-            loan.save()
-            
-            logger.info(f"Loan {loan_id} deleted successfully")
-            return {'success': True, 'sms': 'Loan deleted successfully!'}
-            
-        except Loans.DoesNotExist:
-            return {'success': False, 'sms': 'Loan not found.'}
-        except Exception as e:
-            logger.error(f"Error deleting loan {loan_id}: {str(e)}")
-            return {'success': False, 'sms': str(e)}
+    touch_created_at = True
+    
+    @classmethod
+    def update_changes(cls, post_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Name and description changes plus a payment (negative) or top-up (positive) entry"""
+        item, error = cls.input_class.from_post(post_data)
+        if error:
+            return {}, error
+        
+        changes = {'name': item.names, 'description': item.describe}
+        paid = post_data.get('paid')
+        if paid:
+            paid = Decimal(paid)
+            if paid < 0:
+                changes['paid'] = F('paid') + abs(paid)
+            else:
+                changes['amount'] = F('amount') + paid
+        return changes, None
+
+
+class DebtsService(BalanceRecordService):
+    """Service class for handling Debts management operations"""
+    
+    model = Debts
+    log_label = 'debt'
+    noun = 'Debt'
+    plural = 'debts'
+    created_sms = 'New debt added successfully!'
+    updated_sms = 'Debt details updated successfully!'
+    failed_sms = 'Operation failed..!'
+    update_key = 'debt_id'
+
+
+class LoansService(BalanceRecordService):
+    """Service class for handling Loans management operations"""
+    
+    model = Loans
+    log_label = 'loan'
+    noun = 'Loan'
+    plural = 'loans'
+    created_sms = 'New loan added successfully!'
+    updated_sms = 'Loan details updated successfully!'
+    update_key = 'loan_id'
 
 
 # EXPENSES MANAGEMENT SERVICES
-class ExpensesService:
+class ExpensesService(RecordService):
     """Service class for handling Expenses management operations"""
     
-    @staticmethod
-    def create_expense(post_data: Dict[str, Any], user) -> Dict[str, Any]:
-        """Create a new expense"""
-        try:
-            exp_date = post_data.get('dates')
-            exp_title = post_data.get('title', '').strip()
-            exp_amount = post_data.get('amount')
-            exp_describe = post_data.get('describe', '').strip()
-            
-            if len(exp_title) < 3:
-                return {'success': False, 'sms': 'Title must have atleast 3 characters.'}
-            
-            exp_describe = None if exp_describe == "" else exp_describe
-            
-            Expenses.objects.create(
-                dates=exp_date,
-                title=exp_title,
-                amount=exp_amount,
-                description=exp_describe,
-                user=user,
-                shop=user.shop
-            )
-            
-            logger.info("New expense created successfully")
-            return {'success': True, 'sms': 'New expense added successfully!'}
-            
-        except Exception as e:
-            logger.error(f"Error creating expense: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed..!'}
+    model = Expenses
+    input_class = ExpenseInput
+    log_label = 'expense'
+    noun = 'Expense'
+    plural = 'expenses'
+    created_sms = 'New expense added successfully!'
+    updated_sms = 'Expense details updated successfully!'
+    failed_sms = 'Operation failed..!'
+    touch_created_at = True
+    update_key = 'expense_edit'
+    delete_key = 'expense_delete'
+    delete_many_key = 'expense_delete_ids[]'
     
-    @staticmethod
-    def update_expense(post_data: Dict[str, Any], expense_id: int, user) -> Dict[str, Any]:
-        """Update an existing expense"""
-        try:
-            expense = Expenses.objects.get(id=expense_id)
-            exp_date = post_data.get('dates')
-            exp_title = post_data.get('title', '').strip()
-            exp_amount = post_data.get('amount')
-            exp_describe = post_data.get('describe', '').strip()
-            
-            if len(exp_title) < 3:
-                return {'success': False, 'sms': 'Title must have atleast 3 characters.'}
-            
-            exp_describe = None if exp_describe == "" else exp_describe
-            
-            expense.dates = exp_date
-            expense.title = exp_title
-            expense.amount = exp_amount
-            expense.description = exp_describe
-            expense.user = user
-            expense.shop = user.shop
-            expense.save()
-            
-            logger.info(f"Expense {expense_id} updated successfully")
-            return {'success': True, 'sms': 'Expense details updated successfully!'}
-            
-        except Expenses.DoesNotExist:
-            return {'success': False, 'sms': 'Expense not found.'}
-        except Exception as e:
-            logger.error(f"Error updating expense {expense_id}: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed..!'}
+    @classmethod
+    def handle_actions(cls, request: HttpRequest) -> Dict[str, Any]:
+        """Route an expense POST, answering detail views before the shared operations"""
+        expense_view = request.POST.get('expense_view')
+        if request.method == 'POST' and expense_view and not request.POST.getlist(cls.delete_many_key):
+            return cls.view_expense(expense_view)
+        return super().handle_actions(request)
     
-    @staticmethod
-    def delete_expense(expense_id: int) -> Dict[str, Any]:
-        """Delete an expense"""
-        try:
-            expense = Expenses.objects.get(id=expense_id)
-            expense.deleted = 1
-            expense.save()
-            
-            logger.info(f"Expense {expense_id} deleted successfully")
-            return {'success': True, 'sms': 'Expense deleted successfully!'}
-            
-        except Expenses.DoesNotExist:
-            return {'success': False, 'sms': 'Expense not found.'}
-        except Exception as e:
-            logger.error(f"Error deleting expense {expense_id}: {str(e)}")
-            return {'success': False, 'sms': 'Operation failed..!'}
+    @classmethod
+    def build_record(cls, item: ExpenseInput, user):
+        """Build an unsaved expense from a validated input"""
+        return Expenses(
+            dates=item.dates, title=item.title, amount=item.amount,
+            description=item.describe, user=user, shop=user.shop
+        )
+    
+    @classmethod
+    def update_changes(cls, post_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Field values an expense edit writes, or the validation message"""
+        item, error = ExpenseInput.from_post(post_data)
+        if error:
+            return {}, error
+        return {'dates': item.dates, 'title': item.title, 'amount': item.amount, 'description': item.describe}, None
     
     @staticmethod
     def view_expense(expense_id: int) -> Dict[str, Any]:
         """View expense details"""
         try:
-            expense = Expenses.objects.get(id=expense_id)
+            expense = Expenses.objects.filter(id=expense_id).values(
+                'created_at', 'dates', 'title', 'amount', 'description',
+                'user__username', 'shop__names', 'shop__abbrev'
+            ).first()
+            if not expense:
+                return {'success': False, 'sms': 'Expense not found.'}
             
             return {
                 'success': True,
-                'regdate': expense.created_at.strftime('%d-%b-%Y %H:%M:%S'),
-                'dates': expense.dates.strftime('%d-%b-%Y'),
-                'dates_form': expense.dates,
-                'title': expense.title,
-                'amount': format_number(expense.amount) + ' TZS',
-                'amount_form': expense.amount,
-                'describe': 'N/A' if expense.description is None else expense.description,
-                'user': expense.user.username,
-                'shop': f"{expense.shop.names} ({expense.shop.abbrev})",
+                'regdate': expense['created_at'].strftime('%d-%b-%Y %H:%M:%S'),
+                'dates': format_date(expense['dates']),
+                'dates_form': expense['dates'],
+                'title': expense['title'],
+                'amount': format_number(expense['amount']) + ' TZS',
+                'amount_form': expense['amount'],
+                'describe': 'N/A' if expense['description'] is None else expense['description'],
+                'user': expense['user__username'],
+                'shop': f"{expense['shop__names']} ({expense['shop__abbrev']})",
             }
             
-        except Expenses.DoesNotExist:
-            return {'success': False, 'sms': 'Expense not found.'}
         except Exception as e:
             logger.error(f"Error viewing expense {expense_id}: {str(e)}")
             return {'success': False, 'sms': 'Operation failed..!'}
 
 
 # DATATABLES UTILITIES
+class DataTablesCacheService:
+    """Service class for caching DataTables payloads per model and request"""
+    
+    CACHE_TIMEOUT = 60
+    IGNORED_PARAMS = ('draw', 'csrfmiddlewaretoken')
+    PAGING_PARAMS = ('start', 'length', 'order')
+    
+    @staticmethod
+    def version_key(model) -> str:
+        """Cache key holding the current payload version of a model"""
+        return f"miamala:{model._meta.label_lower}:version"
+    
+    @staticmethod
+    def get_version(model) -> int:
+        """Get the model's cache version, starting a new one if missing"""
+        key = DataTablesCacheService.version_key(model)
+        version = cache.get(key)
+        if version is None:
+            version = time.time_ns()
+            cache.set(key, version, None)
+        return version
+    
+    @staticmethod
+    def get_key(model, request: HttpRequest, kind: str = 'page') -> str:
+        """Build the cache key for a DataTables draw, or with kind 'totals' for its filters only"""
+        ignored = DataTablesCacheService.IGNORED_PARAMS
+        if kind == 'totals':
+            ignored += DataTablesCacheService.PAGING_PARAMS
+        params = sorted(
+            (key, request.POST.getlist(key)) for key in request.POST
+            if key.split('[', 1)[0] not in ignored
+        )
+        digest = hashlib.blake2b(json.dumps(params).encode(), digest_size=16).hexdigest()
+        scope = 'all' if request.user.is_admin else request.user.shop_id
+        return (
+            f"miamala:{model._meta.label_lower}:{DataTablesCacheService.get_version(model)}:"
+            f"{kind}:{scope}:{digest}"
+        )
+    
+    @staticmethod
+    def get(cache_key: str, draw: int) -> Optional[Dict[str, Any]]:
+        """Get a cached payload stamped with the current draw counter"""
+        payload = cache.get(cache_key)
+        if payload is None:
+            return None
+        return {**payload, 'draw': draw}
+    
+    @staticmethod
+    def set(cache_key: str, ajax_response: Dict[str, Any]):
+        """Cache a fully built payload"""
+        cache.set(cache_key, ajax_response, DataTablesCacheService.CACHE_TIMEOUT)
+    
+    @staticmethod
+    def get_totals(cache_key: str) -> Optional[Tuple[int, int, Dict[str, str]]]:
+        """Get the cached counts and grand totals of a filter signature"""
+        return cache.get(cache_key)
+    
+    @staticmethod
+    def set_totals(cache_key: str, totals: Tuple[int, int, Dict[str, str]]):
+        """Cache the counts and grand totals of a filter signature"""
+        cache.set(cache_key, totals, DataTablesCacheService.CACHE_TIMEOUT)
+    
+    @staticmethod
+    def invalidate(model):
+        """Invalidate all cached payloads of a model by moving to a new version"""
+        cache.set(DataTablesCacheService.version_key(model), time.time_ns(), None)
+
+
 class DataTablesService:
     """Service class for handling DataTables functionality"""
     
     @staticmethod
     def parse_request_params(request: HttpRequest) -> Dict[str, Any]:
         """Parse DataTables AJAX request parameters"""
+        get = request.POST.get
         return {
-            'draw': int(request.POST.get('draw', 0)),
-            'start': int(request.POST.get('start', 0)),
-            'length': int(request.POST.get('length', 10)),
-            'search_value': request.POST.get('search[value]', ''),
-            'order_column_index': int(request.POST.get('order[0][column]', 1)),
-            'order_dir': request.POST.get('order[0][dir]', 'desc'),
-            'start_date_str': request.POST.get('startdate'),
-            'end_date_str': request.POST.get('enddate'),
+            'draw': int(get('draw', 0)),
+            'start': int(get('start', 0)),
+            'length': int(get('length', 10)) or 10,
+            'search_value': get('search[value]', ''),
+            'order_column_index': int(get('order[0][column]', 1)),
+            'order_dir': get('order[0][dir]', 'desc'),
+            'start_date_str': get('startdate'),
+            'end_date_str': get('enddate'),
         }
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_client_date(date_str: str) -> datetime:
+        """Parse a client date (normally ISO-8601) into a UTC datetime, cached per string"""
+        try:
+            parsed = datetime.fromisoformat(date_str)
+        except ValueError:
+            parsed = parse(date_str)
+        return parsed.astimezone(_UTC)
+    
+    @staticmethod
+    def base_queryset(model, user) -> QuerySet:
+        """Live rows visible to the user in a single filter, scoped to their shop unless admin"""
+        conditions = Q(deleted=False)
+        if not user.is_admin:
+            conditions &= Q(shop_id=user.shop_id)
+        return model.objects.filter(conditions)
+    
     @staticmethod
     def apply_date_filtering(queryset: QuerySet, start_date_str: str, end_date_str: str) -> QuerySet:
         """Apply date range filtering to queryset"""
@@ -507,10 +544,10 @@ class DataTablesService:
             parsed_end_date = None
             
             if start_date_str:
-                parsed_start_date = parse(start_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_start_date = DataTablesService.parse_client_date(start_date_str)
             
             if end_date_str:
-                parsed_end_date = parse(end_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_end_date = DataTablesService.parse_client_date(end_date_str)
             
             if parsed_start_date and parsed_end_date:
                 return queryset.filter(created_at__range=(parsed_start_date, parsed_end_date))
@@ -525,49 +562,177 @@ class DataTablesService:
         return queryset
     
     @staticmethod
-    def apply_sorting(data: List[Dict], column_mapping: Dict, order_column_index: int, order_dir: str) -> List[Dict]:
-        """Apply sorting to data list"""
-        order_column_name = column_mapping.get(order_column_index, 'dates')
-        reverse_order = order_dir == 'desc'
+    def apply_sorting(queryset: QuerySet, order_fields: Dict[int, str], order_column_index: int, order_dir: str) -> QuerySet:
+        """Apply database ordering to queryset, falling back to the dates column"""
+        order_field = order_fields.get(order_column_index) or order_fields[None]
+        if order_dir == 'desc':
+            order_field = f'-{order_field}'
         
-        return sorted(data, key=lambda x: x[order_column_name], reverse=reverse_order)
+        # Ties keep id order, as the previous stable in-memory sort did
+        return queryset.order_by(order_field, 'id')
     
     @staticmethod
-    def apply_column_filtering(data: List[Dict], request: HttpRequest, column_mapping: Dict, column_filter_types: Dict) -> List[Dict]:
-        """Apply individual column filtering"""
-        filtered_data = data
+    def apply_column_filtering(queryset: QuerySet, request: HttpRequest, column_filters: Tuple) -> QuerySet:
+        """Apply individual column filtering from precomputed (POST key, field, filter type) specs"""
+        conditions = [
+            filter_query(field, column_search, filter_type)
+            for post_key, field, filter_type in column_filters
+            if (column_search := request.POST.get(post_key))
+        ]
         
-        for i in range(len(column_mapping)):
-            column_search = request.POST.get(f'columns[{i}][search][value]', '')
-            if column_search:
-                column_field = column_mapping.get(i)
-                if column_field:
-                    filter_type = column_filter_types.get(column_field, 'contains')
-                    filtered_data = [
-                        item for item in filtered_data 
-                        if filter_items(column_field, column_search, item, filter_type)
-                    ]
+        if not conditions:
+            return queryset
         
-        return filtered_data
+        return queryset.filter(*conditions)
     
     @staticmethod
-    def apply_global_search(data: List[Dict], search_value: str) -> List[Dict]:
-        """Apply global search filtering"""
+    def apply_global_search(queryset: QuerySet, search_value: str, search_lookups: Tuple[str, ...]) -> QuerySet:
+        """Apply global search filtering over precomputed icontains lookups"""
         if not search_value:
-            return data
+            return queryset
         
-        search_lower = search_value.lower()
-        return [
-            item for item in data 
-            if any(str(value).lower().find(search_lower) != -1 for value in item.values())
-        ]
+        return queryset.filter(reduce(or_, (Q(**{lookup: search_value}) for lookup in search_lookups)))
     
     @staticmethod
-    def paginate_data(data: List[Dict], start: int, length: int) -> List[Dict]:
-        """Apply pagination to data"""
+    def paginate_data(queryset: QuerySet, start: int, length: int) -> QuerySet:
+        """Apply pagination to queryset"""
         if length < 0:
-            return data
-        return data[start:start + length]
+            return queryset
+        return queryset[start:start + length]
+    
+    @staticmethod
+    def user_display_expression() -> Case:
+        """Database-side equivalent of the 'username (Admin)' display string"""
+        return Case(
+            When(user__is_admin=True, then=Concat('user__username', Value(' (Admin)'))),
+            default=F('user__username'),
+            output_field=CharField()
+        )
+    
+    @staticmethod
+    def aggregate_totals(queryset: QuerySet, fields: List[str]) -> Tuple[int, Dict[str, str]]:
+        """Count the rows and sum the given columns in a single aggregate query"""
+        totals = queryset.aggregate(row_count=Count('id'), **{
+            f'total_{field}': Coalesce(Sum(field), Value(Decimal('0')), output_field=DecimalField())
+            for field in fields
+        })
+        row_count = totals.pop('row_count')
+        return row_count, {key: format_number(value) for key, value in totals.items()}
+    
+    @staticmethod
+    def render(request: HttpRequest, model, data_service, template: str) -> HttpResponse:
+        """Render a records page, or answer its DataTables AJAX draw"""
+        if request.method != "POST":
+            return render(request, template)
+        
+        try:
+            # Parse request parameters
+            params = DataTablesService.parse_request_params(request)
+            
+            # Serve an unchanged draw from cache
+            cache_key = DataTablesCacheService.get_key(model, request)
+            cached_response = DataTablesCacheService.get(cache_key, params['draw'])
+            if cached_response is not None:
+                return DataTablesService.json_response(cached_response)
+            
+            # Base queryset with user restrictions and date filtering
+            queryset = DataTablesService.base_queryset(model, request.user)
+            queryset = data_service.filter_dates(queryset, request, params)
+            
+            # Annotate computed columns, keeping the plain queryset for the unfiltered count
+            base_queryset = queryset
+            queryset = data_service.annotate_queryset(queryset)
+            
+            # Apply column filtering
+            filtered_queryset = DataTablesService.apply_column_filtering(
+                queryset, request, data_service.COLUMN_FILTERS
+            )
+            
+            # Apply global search
+            filtered_queryset = DataTablesService.apply_global_search(
+                filtered_queryset, params['search_value'], data_service.SEARCH_LOOKUPS
+            )
+            
+            # Counts and grand totals only depend on the filters, so paging and
+            # sorting through the same filters reuses them from cache
+            totals_key = DataTablesCacheService.get_key(model, request, 'totals')
+            totals = DataTablesCacheService.get_totals(totals_key)
+            if totals is None:
+                # Count the filtered rows and sum the grand totals in one query; the
+                # unfiltered count needs its own query only when a filter applied
+                records_filtered, grand_totals = data_service.calculate_grand_totals(filtered_queryset)
+                if filtered_queryset is queryset:
+                    total_records = records_filtered
+                else:
+                    total_records = base_queryset.count()
+                DataTablesCacheService.set_totals(totals_key, (records_filtered, total_records, grand_totals))
+            else:
+                records_filtered, total_records, grand_totals = totals
+            
+            # Apply sorting
+            filtered_queryset = DataTablesService.apply_sorting(
+                filtered_queryset, data_service.ORDER_FIELDS,
+                params['order_column_index'], params['order_dir']
+            )
+            
+            # Apply pagination
+            paginated_queryset = DataTablesService.paginate_data(
+                filtered_queryset, params['start'], params['length']
+            )
+            
+            # Calculate row count start
+            row_count_start = DataTablesService.calculate_row_count_start(
+                params['start'], params['length']
+            )
+            
+            # Prepare AJAX response
+            ajax_response = {
+                'draw': params['draw'],
+                'recordsTotal': total_records,
+                'recordsFiltered': records_filtered,
+                'data': data_service.format_final_data(paginated_queryset, row_count_start),
+                'grand_totals': grand_totals
+            }
+            return DataTablesService.json_response(
+                ajax_response, stream=params['length'] < 0, cache_key=cache_key
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in {model.__name__} DataTables: {str(e)}")
+            return JsonResponse({
+                'draw': 0,
+                'recordsTotal': 0,
+                'recordsFiltered': 0,
+                'data': [],
+                'error': 'Failed to load data'
+            })
+    
+    @staticmethod
+    def json_response(ajax_response: Dict[str, Any], stream: bool = False,
+                      cache_key: Optional[str] = None) -> HttpResponse:
+        """Return the DataTables payload, streaming the rows when the whole table was requested"""
+        if not stream:
+            ajax_response['data'] = list(ajax_response['data'])
+            if cache_key:
+                DataTablesCacheService.set(cache_key, ajax_response)
+            return HttpResponse(DataTablesService.dumps(ajax_response), content_type='application/json')
+        return StreamingHttpResponse(
+            DataTablesService.iter_json(ajax_response), content_type='application/json'
+        )
+    
+    @staticmethod
+    def iter_json(ajax_response: Dict[str, Any]) -> Iterator[bytes]:
+        """Serialise a DataTables payload piece by piece so rows never sit in memory together"""
+        header = {key: value for key, value in ajax_response.items() if key != 'data'}
+        yield DataTablesService.dumps(header)[:-1] + b',"data":['
+        for i, row in enumerate(ajax_response['data']):
+            yield (b',' if i else b'') + DataTablesService.dumps(row)
+        yield b']}'
+    
+    @staticmethod
+    def dumps(data: Any) -> bytes:
+        """Encode with orjson; Decimals are written as strings, as DjangoJSONEncoder did"""
+        return orjson.dumps(data, default=str)
     
     @staticmethod
     def calculate_row_count_start(start: int, length: int) -> int:
@@ -576,8 +741,32 @@ class DataTablesService:
         return (page_number - 1) * length + 1
 
 
+# SHARED DATA PROCESSING
+class TableDataService:
+    """Hooks shared by the per-model DataTables data services"""
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the column specs each draw needs once, when the service class is defined"""
+        super().__init_subclass__(**kwargs)
+        cls.COLUMN_FILTERS = tuple(
+            (f'columns[{i}][search][value]', cls.FIELD_MAPPING[column],
+             cls.COLUMN_FILTER_TYPES.get(column, 'contains'))
+            for i, column in cls.COLUMN_MAPPING.items()
+        )
+        cls.ORDER_FIELDS = {i: cls.FIELD_MAPPING[column] for i, column in cls.COLUMN_MAPPING.items()}
+        cls.ORDER_FIELDS[None] = cls.FIELD_MAPPING['dates']
+        cls.SEARCH_LOOKUPS = tuple(f'{field}__icontains' for field in cls.SEARCH_FIELDS)
+    
+    @staticmethod
+    def filter_dates(queryset: QuerySet, request: HttpRequest, params: Dict[str, Any]) -> QuerySet:
+        """Apply the page's date range filter"""
+        return DataTablesService.apply_date_filtering(
+            queryset, params['start_date_str'], params['end_date_str']
+        )
+
+
 # SELCOMPAY DATA PROCESSING
-class SelcomPayDataService:
+class SelcomPayDataService(TableDataService):
     """Service class for SelcomPay data processing"""
     
     COLUMN_MAPPING = {
@@ -590,60 +779,60 @@ class SelcomPayDataService:
         6: 'user'
     }
     
+    FIELD_MAPPING = {
+        'id': 'id',
+        'dates': 'created_at',
+        'names': 'name',
+        'amount': 'amount',
+        'profit': 'profit',
+        'shop': 'shop__abbrev',
+        'user': 'user_display',
+    }
+    
     COLUMN_FILTER_TYPES = {
         'profit': 'numeric',
         'amount': 'numeric',
     }
     
+    SEARCH_FIELDS = ['id', 'created_at', 'name', 'amount', 'profit', 'shop__abbrev', 'user_display', 'description']
+    
     @staticmethod
-    def prepare_base_data(queryset: QuerySet) -> List[Dict[str, Any]]:
-        """Convert SelcomPay queryset to list of dicts"""
-        return [
-            {
-                'id': transact.id,
-                'dates': transact.created_at,
-                'names': transact.name,
-                'amount': transact.amount,
-                'profit': selcom_profit(transact.amount),
-                'shop': transact.shop.abbrev,
-                'user': f'{transact.user.username} (Admin)' if transact.user.is_admin else transact.user.username,
-                'describe': transact.description if transact.description else ""
-            }
-            for transact in queryset
-        ]
+    def annotate_queryset(queryset: QuerySet) -> QuerySet:
+        """Annotate computed SelcomPay columns so they can be filtered and sorted in SQL"""
+        return queryset.annotate(
+            profit=selcom_profit_expression(),
+            user_display=DataTablesService.user_display_expression()
+        )
     
     @staticmethod
-    def format_final_data(data: List[Dict], row_count_start: int) -> List[Dict]:
-        """Format data for final DataTables response"""
-        return [
+    def format_final_data(queryset: QuerySet, row_count_start: int) -> Iterator[Dict]:
+        """Format the SelcomPay page rows for the DataTables response in a single pass"""
+        rows = queryset.values(
+            'id', 'created_at', 'name', 'amount', 'profit', 'shop__abbrev', 'user_display', 'description'
+        ).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        return (
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'dates': conv_timezone(item.get('dates'), '%d-%b-%Y %H:%M'),
-                'names': item.get('names'),
-                'shop': item.get('shop'),
-                'user': item.get('user'),
-                'amount': format_number(item.get('amount')),
-                'profit': format_number(item.get('profit')),
-                'describe': item.get('describe'),
-                'action': ""
+                'id': row['id'],
+                'dates': conv_timezone(row['created_at'], '%d-%b-%Y %H:%M'),
+                'names': row['name'],
+                'shop': row['shop__abbrev'],
+                'user': row['user_display'],
+                'amount': format_number(row['amount']),
+                'profit': format_number(row['profit']),
+                'describe': row['description'] or ""
             }
-            for i, item in enumerate(data)
-        ]
+            for i, row in enumerate(rows)
+        )
     
     @staticmethod
-    def calculate_grand_totals(data: List[Dict]) -> Dict[str, str]:
-        """Calculate grand totals for SelcomPay data"""
-        total_amount = sum(item['amount'] for item in data)
-        total_profit = sum(item['profit'] for item in data)
-        return {
-            'total_amount': format_number(total_amount),
-            'total_profit': format_number(total_profit),
-        }
+    def calculate_grand_totals(queryset: QuerySet) -> Tuple[int, Dict[str, str]]:
+        """Count rows and calculate grand totals for SelcomPay data"""
+        return DataTablesService.aggregate_totals(queryset, ['amount', 'profit'])
 
 
 # LIPANAMBA DATA PROCESSING
-class LipaNambaDataService:
+class LipaNambaDataService(TableDataService):
     """Service class for LipaNamba data processing"""
     
     COLUMN_MAPPING = {
@@ -656,60 +845,60 @@ class LipaNambaDataService:
         6: 'user',
     }
     
+    FIELD_MAPPING = {
+        'id': 'id',
+        'dates': 'created_at',
+        'names': 'name',
+        'amount': 'amount',
+        'profit': 'profit',
+        'shop': 'shop__abbrev',
+        'user': 'user_display',
+    }
+    
     COLUMN_FILTER_TYPES = {
         'profit': 'numeric',
         'amount': 'numeric',
     }
     
+    SEARCH_FIELDS = ['id', 'created_at', 'name', 'amount', 'profit', 'shop__abbrev', 'user_display', 'description']
+    
     @staticmethod
-    def prepare_base_data(queryset: QuerySet) -> List[Dict[str, Any]]:
-        """Convert LipaNamba queryset to list of dicts"""
-        return [
-            {
-                'id': transact.id,
-                'dates': transact.created_at,
-                'names': transact.name,
-                'amount': transact.amount,
-                'shop': transact.shop.abbrev,
-                'user': f'{transact.user.username} (Admin)' if transact.user.is_admin else transact.user.username,
-                'profit': lipa_profit(transact.amount),
-                'describe': transact.description if transact.description else ""
-            }
-            for transact in queryset
-        ]
+    def annotate_queryset(queryset: QuerySet) -> QuerySet:
+        """Annotate computed LipaNamba columns so they can be filtered and sorted in SQL"""
+        return queryset.annotate(
+            profit=lipa_profit_expression(),
+            user_display=DataTablesService.user_display_expression()
+        )
     
     @staticmethod
-    def format_final_data(data: List[Dict], row_count_start: int) -> List[Dict]:
-        """Format data for final DataTables response"""
-        return [
+    def format_final_data(queryset: QuerySet, row_count_start: int) -> Iterator[Dict]:
+        """Format the LipaNamba page rows for the DataTables response in a single pass"""
+        rows = queryset.values(
+            'id', 'created_at', 'name', 'amount', 'profit', 'shop__abbrev', 'user_display', 'description'
+        ).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        return (
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'dates': conv_timezone(item.get('dates'), '%d-%b-%Y %H:%M'),
-                'names': item.get('names'),
-                'shop': item.get('shop'),
-                'user': item.get('user'),
-                'amount': format_number(item.get('amount')),
-                'profit': format_number(item.get('profit')),
-                'describe': item.get('describe'),
-                'action': ""
+                'id': row['id'],
+                'dates': conv_timezone(row['created_at'], '%d-%b-%Y %H:%M'),
+                'names': row['name'],
+                'shop': row['shop__abbrev'],
+                'user': row['user_display'],
+                'amount': format_number(row['amount']),
+                'profit': format_number(row['profit']),
+                'describe': row['description'] or ""
             }
-            for i, item in enumerate(data)
-        ]
+            for i, row in enumerate(rows)
+        )
     
     @staticmethod
-    def calculate_grand_totals(data: List[Dict]) -> Dict[str, str]:
-        """Calculate grand totals for LipaNamba data"""
-        total_amount = sum(item['amount'] for item in data)
-        total_profit = sum(item['profit'] for item in data)
-        return {
-            'total_amount': format_number(total_amount),
-            'total_profit': format_number(total_profit),
-        }
+    def calculate_grand_totals(queryset: QuerySet) -> Tuple[int, Dict[str, str]]:
+        """Count rows and calculate grand totals for LipaNamba data"""
+        return DataTablesService.aggregate_totals(queryset, ['amount', 'profit'])
 
 
 # DEBTS DATA PROCESSING
-class DebtsDataService:
+class DebtsDataService(TableDataService):
     """Service class for Debts data processing"""
     
     COLUMN_MAPPING = {
@@ -723,65 +912,63 @@ class DebtsDataService:
         7: 'user',
     }
     
+    FIELD_MAPPING = {
+        'id': 'id',
+        'dates': 'created_at',
+        'names': 'name',
+        'amount': 'amount',
+        'paid': 'paid',
+        'balance': 'balance',
+        'shop': 'shop__abbrev',
+        'user': 'user_display',
+    }
+    
     COLUMN_FILTER_TYPES = {
         'paid': 'numeric',
         'amount': 'numeric',
         'balance': 'numeric',
     }
     
+    SEARCH_FIELDS = ['id', 'created_at', 'name', 'amount', 'paid', 'balance', 'shop__abbrev', 'user_display', 'description']
+    
     @staticmethod
-    def prepare_base_data(queryset: QuerySet) -> List[Dict[str, Any]]:
-        """Convert Debts queryset to list of dicts"""
-        return [
-            {
-                'id': debt.id,
-                'dates': debt.created_at,
-                'names': debt.name,
-                'amount': debt.amount,
-                'paid': debt.paid,
-                'balance': debt.amount - debt.paid,
-                'user': f'{debt.user.username} (Admin)' if debt.user.is_admin else debt.user.username,
-                'shop': debt.shop.abbrev,
-                'describe': debt.description if debt.description else ""
-            }
-            for debt in queryset
-        ]
+    def annotate_queryset(queryset: QuerySet) -> QuerySet:
+        """Annotate computed Debts columns so they can be filtered and sorted in SQL"""
+        return queryset.annotate(
+            balance=F('amount') - F('paid'),
+            user_display=DataTablesService.user_display_expression()
+        )
     
     @staticmethod
-    def format_final_data(data: List[Dict], row_count_start: int) -> List[Dict]:
-        """Format data for final DataTables response"""
-        return [
+    def format_final_data(queryset: QuerySet, row_count_start: int) -> Iterator[Dict]:
+        """Format the Debts page rows for the DataTables response in a single pass"""
+        rows = queryset.values(
+            'id', 'created_at', 'name', 'amount', 'paid', 'balance', 'shop__abbrev', 'user_display', 'description'
+        ).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        return (
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'dates': conv_timezone(item.get('dates'), '%d-%b-%Y %H:%M'),
-                'names': item.get('names'),
-                'amount': format_number(item.get('amount')),
-                'paid': format_number(item.get('paid')),
-                'balance': format_number(item.get('balance')),
-                'describe': item.get('describe'),
-                'shop': item.get('shop'),
-                'user': item.get('user'),
-                'action': ""
+                'id': row['id'],
+                'dates': conv_timezone(row['created_at'], '%d-%b-%Y %H:%M'),
+                'names': row['name'],
+                'amount': format_number(row['amount']),
+                'paid': format_number(row['paid']),
+                'balance': format_number(row['balance']),
+                'describe': row['description'] or "",
+                'shop': row['shop__abbrev'],
+                'user': row['user_display']
             }
-            for i, item in enumerate(data)
-        ]
+            for i, row in enumerate(rows)
+        )
     
     @staticmethod
-    def calculate_grand_totals(data: List[Dict]) -> Dict[str, str]:
-        """Calculate grand totals for Debts data"""
-        total_amount = sum(item['amount'] for item in data)
-        total_paid = sum(item['paid'] for item in data)
-        total_balance = sum(item['balance'] for item in data)
-        return {
-            'total_amount': format_number(total_amount),
-            'total_paid': format_number(total_paid),
-            'total_balance': format_number(total_balance),
-        }
+    def calculate_grand_totals(queryset: QuerySet) -> Tuple[int, Dict[str, str]]:
+        """Count rows and calculate grand totals for Debts data"""
+        return DataTablesService.aggregate_totals(queryset, ['amount', 'paid', 'balance'])
 
 
 # LOANS DATA PROCESSING
-class LoansDataService:
+class LoansDataService(TableDataService):
     """Service class for Loans data processing"""
     
     COLUMN_MAPPING = {
@@ -795,65 +982,63 @@ class LoansDataService:
         7: 'user',
     }
     
+    FIELD_MAPPING = {
+        'id': 'id',
+        'dates': 'created_at',
+        'names': 'name',
+        'amount': 'amount',
+        'paid': 'paid',
+        'balance': 'balance',
+        'shop': 'shop__abbrev',
+        'user': 'user_display',
+    }
+    
     COLUMN_FILTER_TYPES = {
         'paid': 'numeric',
         'amount': 'numeric',
         'balance': 'numeric',
     }
     
+    SEARCH_FIELDS = ['id', 'created_at', 'name', 'amount', 'paid', 'balance', 'shop__abbrev', 'user_display', 'description']
+    
     @staticmethod
-    def prepare_base_data(queryset: QuerySet) -> List[Dict[str, Any]]:
-        """Convert Loans queryset to list of dicts"""
-        return [
-            {
-                'id': loan.id,
-                'dates': loan.created_at,
-                'names': loan.name,
-                'amount': loan.amount,
-                'paid': loan.paid,
-                'balance': loan.amount - loan.paid,
-                'user': f'{loan.user.username} (Admin)' if loan.user.is_admin else loan.user.username,
-                'shop': loan.shop.abbrev,
-                'describe': loan.description if loan.description else ""
-            }
-            for loan in queryset
-        ]
+    def annotate_queryset(queryset: QuerySet) -> QuerySet:
+        """Annotate computed Loans columns so they can be filtered and sorted in SQL"""
+        return queryset.annotate(
+            balance=F('amount') - F('paid'),
+            user_display=DataTablesService.user_display_expression()
+        )
     
     @staticmethod
-    def format_final_data(data: List[Dict], row_count_start: int) -> List[Dict]:
-        """Format data for final DataTables response"""
-        return [
+    def format_final_data(queryset: QuerySet, row_count_start: int) -> Iterator[Dict]:
+        """Format the Loans page rows for the DataTables response in a single pass"""
+        rows = queryset.values(
+            'id', 'created_at', 'name', 'amount', 'paid', 'balance', 'shop__abbrev', 'user_display', 'description'
+        ).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        return (
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'dates': conv_timezone(item.get('dates'), '%d-%b-%Y %H:%M'),
-                'names': item.get('names'),
-                'amount': format_number(item.get('amount')),
-                'paid': format_number(item.get('paid')),
-                'balance': format_number(item.get('balance')),
-                'describe': item.get('describe'),
-                'shop': item.get('shop'),
-                'user': item.get('user'),
-                'action': ""
+                'id': row['id'],
+                'dates': conv_timezone(row['created_at'], '%d-%b-%Y %H:%M'),
+                'names': row['name'],
+                'amount': format_number(row['amount']),
+                'paid': format_number(row['paid']),
+                'balance': format_number(row['balance']),
+                'describe': row['description'] or "",
+                'shop': row['shop__abbrev'],
+                'user': row['user_display']
             }
-            for i, item in enumerate(data)
-        ]
+            for i, row in enumerate(rows)
+        )
     
     @staticmethod
-    def calculate_grand_totals(data: List[Dict]) -> Dict[str, str]:
-        """Calculate grand totals for Loans data"""
-        total_amount = sum(item['amount'] for item in data)
-        total_paid = sum(item['paid'] for item in data)
-        total_balance = sum(item['balance'] for item in data)
-        return {
-            'total_amount': format_number(total_amount),
-            'total_paid': format_number(total_paid),
-            'total_balance': format_number(total_balance),
-        }
+    def calculate_grand_totals(queryset: QuerySet) -> Tuple[int, Dict[str, str]]:
+        """Count rows and calculate grand totals for Loans data"""
+        return DataTablesService.aggregate_totals(queryset, ['amount', 'paid', 'balance'])
 
 
 # EXPENSES DATA PROCESSING
-class ExpensesDataService:
+class ExpensesDataService(TableDataService):
     """Service class for Expenses data processing"""
     
     COLUMN_MAPPING = {
@@ -865,79 +1050,81 @@ class ExpensesDataService:
         5: 'shop'
     }
     
+    FIELD_MAPPING = {
+        'id': 'id',
+        'dates': 'dates',
+        'title': 'title',
+        'amount': 'amount',
+        'user': 'user_display',
+        'shop': 'shop__abbrev',
+    }
+    
     COLUMN_FILTER_TYPES = {
         'amount': 'numeric',
     }
     
+    SEARCH_FIELDS = ['id', 'dates', 'title', 'amount', 'user_display', 'shop__abbrev']
+    
     @staticmethod
-    def prepare_base_data(queryset: QuerySet) -> List[Dict[str, Any]]:
-        """Convert Expenses queryset to list of dicts"""
-        return [
-            {
-                'id': expense.id,
-                'dates': expense.dates,
-                'title': expense.title,
-                'amount': expense.amount,
-                'user': f'{expense.user.username} (Admin)' if expense.user.is_admin else expense.user.username,
-                'shop': expense.shop.abbrev
-            }
-            for expense in queryset
-        ]
+    def annotate_queryset(queryset: QuerySet) -> QuerySet:
+        """Annotate computed Expenses columns so they can be filtered and sorted in SQL"""
+        return queryset.annotate(user_display=DataTablesService.user_display_expression())
     
     @staticmethod
-    def format_final_data(data: List[Dict], row_count_start: int) -> List[Dict]:
-        """Format data for final DataTables response"""
-        return [
+    def format_final_data(queryset: QuerySet, row_count_start: int) -> Iterator[Dict]:
+        """Format the Expenses page rows for the DataTables response in a single pass"""
+        rows = queryset.values(
+            'id', 'dates', 'title', 'amount', 'user_display', 'shop__abbrev'
+        ).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        return (
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'dates': item.get('dates').strftime('%d-%b-%Y'),
-                'title': item.get('title'),
-                'amount': format_number(item.get('amount')),
-                'user': item.get('user'),
-                'shop': item.get('shop'),
-                'action': ""
+                'id': row['id'],
+                'dates': format_date(row['dates']),
+                'title': row['title'],
+                'amount': format_number(row['amount']),
+                'user': row['user_display'],
+                'shop': row['shop__abbrev']
             }
-            for i, item in enumerate(data)
-        ]
+            for i, row in enumerate(rows)
+        )
     
     @staticmethod
-    def calculate_grand_totals(data: List[Dict]) -> Dict[str, str]:
-        """Calculate grand totals for Expenses data"""
-        total_amount = sum(item['amount'] for item in data)
-        return {
-            'total_amount': format_number(total_amount),
-        }
+    def calculate_grand_totals(queryset: QuerySet) -> Tuple[int, Dict[str, str]]:
+        """Count rows and calculate grand totals for Expenses data"""
+        return DataTablesService.aggregate_totals(queryset, ['amount'])
+    
+    @staticmethod
+    def filter_dates(queryset: QuerySet, request: HttpRequest, params: Dict[str, Any]) -> QuerySet:
+        """Apply the expense date range, posted as plain YYYY-MM-DD dates"""
+        return ExpensesDataService.apply_date_filtering_legacy(
+            queryset, request.POST.get('start_date'), request.POST.get('end_date')
+        )
+    
+    @staticmethod
+    def parse_filter_date(date_str: str) -> date:
+        """Parse a YYYY-MM-DD filter date, also accepting unpadded forms such as 2025-1-10"""
+        # Zero-padded dates from the date inputs take the fast path
+        if ISO_DATE_RE.fullmatch(date_str):
+            return date.fromisoformat(date_str)
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
     
     @staticmethod
     def apply_date_filtering_legacy(queryset: QuerySet, start_date_str: str, end_date_str: str) -> QuerySet:
         """Apply date range filtering using legacy date format"""
         try:
-            format_date_string = "%Y-%m-%d"
-            date_range_filters = Q()
-            
-            start_date = None
-            end_date = None
-            
-            if start_date_str:
-                start_date = datetime.strptime(start_date_str, format_date_string).date()
-            if end_date_str:
-                end_date = datetime.strptime(end_date_str, format_date_string).date()
-
-            if start_date and end_date:
-                date_range_filters |= Q(dates__range=(start_date, end_date))
-            else:
-                if start_date:
-                    date_range_filters |= Q(dates__gte=start_date)
-                elif end_date:
-                    date_range_filters |= Q(dates__lte=end_date)
-
-            if date_range_filters:
-                return queryset.filter(date_range_filters)
-                
-        except Exception as e:
+            start_date = ExpensesDataService.parse_filter_date(start_date_str) if start_date_str else None
+            end_date = ExpensesDataService.parse_filter_date(end_date_str) if end_date_str else None
+        except ValueError as e:
             logger.warning(f"Date filtering error: {str(e)}")
+            return queryset
         
+        if start_date and end_date:
+            return queryset.filter(dates__range=(start_date, end_date))
+        if start_date:
+            return queryset.filter(dates__gte=start_date)
+        if end_date:
+            return queryset.filter(dates__lte=end_date)
         return queryset
 
 
@@ -949,519 +1136,67 @@ class ExpensesDataService:
 @login_required
 def selcom_transactions_page(request: HttpRequest) -> HttpResponse:
     """Handle SelcomPay transactions page display and DataTables AJAX requests"""
-    if request.method == "POST":
-        try:
-            # Parse request parameters
-            params = DataTablesService.parse_request_params(request)
-            
-            # Base queryset
-            queryset = Selcompay.objects.filter(deleted=False)
-            if not request.user.is_admin:
-                queryset = queryset.filter(shop=request.user.shop)
-            
-            # Apply date filtering
-            queryset = DataTablesService.apply_date_filtering(
-                queryset, params['start_date_str'], params['end_date_str']
-            )
-            
-            # Prepare base data
-            base_data = SelcomPayDataService.prepare_base_data(queryset)
-            total_records = len(base_data)
-            
-            # Apply sorting
-            base_data = DataTablesService.apply_sorting(
-                base_data, SelcomPayDataService.COLUMN_MAPPING, 
-                params['order_column_index'], params['order_dir']
-            )
-            
-            # Apply column filtering
-            base_data = DataTablesService.apply_column_filtering(
-                base_data, request, SelcomPayDataService.COLUMN_MAPPING, 
-                SelcomPayDataService.COLUMN_FILTER_TYPES
-            )
-            
-            # Apply global search
-            base_data = DataTablesService.apply_global_search(base_data, params['search_value'])
-            
-            # Calculate filtered record count and grand totals
-            records_filtered = len(base_data)
-            grand_totals = SelcomPayDataService.calculate_grand_totals(base_data)
-            
-            # Apply pagination
-            paginated_data = DataTablesService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            # Calculate row count start
-            row_count_start = DataTablesService.calculate_row_count_start(
-                params['start'], params['length']
-            )
-            
-            # Format final data
-            final_data = SelcomPayDataService.format_final_data(paginated_data, row_count_start)
-            
-            # Prepare AJAX response
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_totals': grand_totals
-            }
-            return JsonResponse(ajax_response)
-            
-        except Exception as e:
-            logger.error(f"Error in selcom_transactions_page DataTables: {str(e)}")
-            return JsonResponse({
-                'draw': 0,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': [],
-                'error': 'Failed to load data'
-            })
-    
-    return render(request, 'miamala/selcom.html')
+    return DataTablesService.render(request, Selcompay, SelcomPayDataService, 'miamala/selcom.html')
 
 
 @never_cache
 @login_required
 def selcom_transactions_actions(request: HttpRequest) -> JsonResponse:
     """Handle SelcomPay transaction actions (add, update, delete)"""
-    if request.method == 'POST':
-        try:
-            post_data = request.POST
-            trans_id = post_data.get('transact_id')
-            delete_id = post_data.get('delete_id')
-            
-            # Route to appropriate service method
-            if delete_id:
-                result = SelcomPayService.delete_transaction(delete_id)
-            elif trans_id:
-                result = SelcomPayService.update_transaction(post_data, trans_id, request.user)
-            else:
-                result = SelcomPayService.create_transaction(post_data, request.user)
-            
-            return JsonResponse(result)
-            
-        except Exception as e:
-            logger.error(f"Error in selcom_transactions_actions: {str(e)}")
-            return JsonResponse({'success': False, 'sms': str(e)})
+    return JsonResponse(SelcomPayService.handle_actions(request))
 
 
 @never_cache
 @login_required
 def lipa_transactions_page(request: HttpRequest) -> HttpResponse:
     """Handle LipaNamba transactions page display and DataTables AJAX requests"""
-    if request.method == "POST":
-        try:
-            # Parse request parameters
-            params = DataTablesService.parse_request_params(request)
-            
-            # Base queryset
-            queryset = Lipanamba.objects.filter(deleted=False)
-            if not request.user.is_admin:
-                queryset = queryset.filter(shop=request.user.shop)
-            
-            # Apply date filtering
-            queryset = DataTablesService.apply_date_filtering(
-                queryset, params['start_date_str'], params['end_date_str']
-            )
-            
-            # Prepare base data
-            base_data = LipaNambaDataService.prepare_base_data(queryset)
-            total_records = len(base_data)
-            
-            # Apply sorting
-            base_data = DataTablesService.apply_sorting(
-                base_data, LipaNambaDataService.COLUMN_MAPPING, 
-                params['order_column_index'], params['order_dir']
-            )
-            
-            # Apply column filtering
-            base_data = DataTablesService.apply_column_filtering(
-                base_data, request, LipaNambaDataService.COLUMN_MAPPING, 
-                LipaNambaDataService.COLUMN_FILTER_TYPES
-            )
-            
-            # Apply global search
-            base_data = DataTablesService.apply_global_search(base_data, params['search_value'])
-            
-            # Calculate filtered record count and grand totals
-            records_filtered = len(base_data)
-            grand_totals = LipaNambaDataService.calculate_grand_totals(base_data)
-            
-            # Apply pagination
-            paginated_data = DataTablesService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            # Calculate row count start
-            row_count_start = DataTablesService.calculate_row_count_start(
-                params['start'], params['length']
-            )
-            
-            # Format final data
-            final_data = LipaNambaDataService.format_final_data(paginated_data, row_count_start)
-            
-            # Prepare AJAX response
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_totals': grand_totals
-            }
-            return JsonResponse(ajax_response)
-            
-        except Exception as e:
-            logger.error(f"Error in lipa_transactions_page DataTables: {str(e)}")
-            return JsonResponse({
-                'draw': 0,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': [],
-                'error': 'Failed to load data'
-            })
-    
-    return render(request, 'miamala/lipanamba.html')
+    return DataTablesService.render(request, Lipanamba, LipaNambaDataService, 'miamala/lipanamba.html')
 
 
 @never_cache
 @login_required
 def lipanamba_transactions_actions(request: HttpRequest) -> JsonResponse:
     """Handle LipaNamba transaction actions (add, update, delete)"""
-    if request.method == 'POST':
-        try:
-            post_data = request.POST
-            trans_id = post_data.get('transact_id')
-            delete_id = post_data.get('delete_id')
-            
-            # Route to appropriate service method
-            if delete_id:
-                result = LipaNambaService.delete_transaction(delete_id)
-            elif trans_id:
-                result = LipaNambaService.update_transaction(post_data, trans_id, request.user)
-            else:
-                result = LipaNambaService.create_transaction(post_data, request.user)
-            
-            return JsonResponse(result)
-            
-        except Exception as e:
-            logger.error(f"Error in lipanamba_transactions_actions: {str(e)}")
-            return JsonResponse({'success': False, 'sms': 'Operation failed'})
+    return JsonResponse(LipaNambaService.handle_actions(request))
 
 
 @never_cache
 @login_required
 def debts_page(request: HttpRequest) -> HttpResponse:
     """Handle Debts page display and DataTables AJAX requests"""
-    if request.method == "POST":
-        try:
-            # Parse request parameters
-            params = DataTablesService.parse_request_params(request)
-            
-            # Base queryset
-            queryset = Debts.objects.filter(deleted=False)
-            if not request.user.is_admin:
-                queryset = queryset.filter(shop=request.user.shop)
-            
-            # Apply date filtering
-            queryset = DataTablesService.apply_date_filtering(
-                queryset, params['start_date_str'], params['end_date_str']
-            )
-            
-            # Prepare base data
-            base_data = DebtsDataService.prepare_base_data(queryset)
-            total_records = len(base_data)
-            
-            # Apply sorting
-            base_data = DataTablesService.apply_sorting(
-                base_data, DebtsDataService.COLUMN_MAPPING, 
-                params['order_column_index'], params['order_dir']
-            )
-            
-            # Apply column filtering
-            base_data = DataTablesService.apply_column_filtering(
-                base_data, request, DebtsDataService.COLUMN_MAPPING, 
-                DebtsDataService.COLUMN_FILTER_TYPES
-            )
-            
-            # Apply global search
-            base_data = DataTablesService.apply_global_search(base_data, params['search_value'])
-            
-            # Calculate filtered record count and grand totals
-            records_filtered = len(base_data)
-            grand_totals = DebtsDataService.calculate_grand_totals(base_data)
-            
-            # Apply pagination
-            paginated_data = DataTablesService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            # Calculate row count start
-            row_count_start = DataTablesService.calculate_row_count_start(
-                params['start'], params['length']
-            )
-            
-            # Format final data
-            final_data = DebtsDataService.format_final_data(paginated_data, row_count_start)
-            
-            # Prepare AJAX response
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_totals': grand_totals
-            }
-            return JsonResponse(ajax_response)
-            
-        except Exception as e:
-            logger.error(f"Error in debts_page DataTables: {str(e)}")
-            return JsonResponse({
-                'draw': 0,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': [],
-                'error': 'Failed to load data'
-            })
-    
-    return render(request, 'miamala/debts.html')
+    return DataTablesService.render(request, Debts, DebtsDataService, 'miamala/debts.html')
 
 
 @never_cache
 @login_required
 def debts_actions(request: HttpRequest) -> JsonResponse:
     """Handle Debts actions (add, update, delete)"""
-    if request.method == 'POST':
-        try:
-            post_data = request.POST
-            debt_id = post_data.get('debt_id')
-            delete_id = post_data.get('delete_id')
-            
-            # Route to appropriate service method
-            if delete_id:
-                result = DebtsService.delete_debt(delete_id)
-            elif debt_id:
-                result = DebtsService.update_debt(post_data, debt_id, request.user)
-            else:
-                result = DebtsService.create_debt(post_data, request.user)
-            
-            return JsonResponse(result)
-            
-        except Exception as e:
-            logger.error(f"Error in debts_actions: {str(e)}")
-            return JsonResponse({'success': False, 'sms': 'Operation failed..!'})
+    return JsonResponse(DebtsService.handle_actions(request))
 
 
 @never_cache
 @login_required
 def loans_page(request: HttpRequest) -> HttpResponse:
     """Handle Loans page display and DataTables AJAX requests"""
-    if request.method == "POST":
-        try:
-            # Parse request parameters
-            params = DataTablesService.parse_request_params(request)
-            
-            # Base queryset
-            queryset = Loans.objects.filter(deleted=False)
-            if not request.user.is_admin:
-                queryset = queryset.filter(shop=request.user.shop)
-            
-            # Apply date filtering
-            queryset = DataTablesService.apply_date_filtering(
-                queryset, params['start_date_str'], params['end_date_str']
-            )
-            
-            # Prepare base data
-            base_data = LoansDataService.prepare_base_data(queryset)
-            total_records = len(base_data)
-            
-            # Apply sorting
-            base_data = DataTablesService.apply_sorting(
-                base_data, LoansDataService.COLUMN_MAPPING, 
-                params['order_column_index'], params['order_dir']
-            )
-            
-            # Apply column filtering
-            base_data = DataTablesService.apply_column_filtering(
-                base_data, request, LoansDataService.COLUMN_MAPPING, 
-                LoansDataService.COLUMN_FILTER_TYPES
-            )
-            
-            # Apply global search
-            base_data = DataTablesService.apply_global_search(base_data, params['search_value'])
-            
-            # Calculate filtered record count and grand totals
-            records_filtered = len(base_data)
-            grand_totals = LoansDataService.calculate_grand_totals(base_data)
-            
-            # Apply pagination
-            paginated_data = DataTablesService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            # Calculate row count start
-            row_count_start = DataTablesService.calculate_row_count_start(
-                params['start'], params['length']
-            )
-            
-            # Format final data
-            final_data = LoansDataService.format_final_data(paginated_data, row_count_start)
-            
-            # Prepare AJAX response
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_totals': grand_totals
-            }
-            return JsonResponse(ajax_response)
-            
-        except Exception as e:
-            logger.error(f"Error in loans_page DataTables: {str(e)}")
-            return JsonResponse({
-                'draw': 0,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': [],
-                'error': 'Failed to load data'
-            })
-    
-    return render(request, 'miamala/loans.html')
+    return DataTablesService.render(request, Loans, LoansDataService, 'miamala/loans.html')
 
 
 @never_cache
 @login_required
 def loans_actions(request: HttpRequest) -> JsonResponse:
     """Handle Loans actions (add, update, delete)"""
-    if request.method == 'POST':
-        try:
-            post_data = request.POST
-            loan_id = post_data.get('loan_id')
-            delete_id = post_data.get('delete_id')
-            
-            # Route to appropriate service method
-            if delete_id:
-                result = LoansService.delete_loan(delete_id)
-            elif loan_id:
-                result = LoansService.update_loan(post_data, loan_id, request.user)
-            else:
-                result = LoansService.create_loan(post_data, request.user)
-            
-            return JsonResponse(result)
-            
-        except Exception as e:
-            logger.error(f"Error in loans_actions: {str(e)}")
-            return JsonResponse({'success': False, 'sms': str(e)})
-        
+    return JsonResponse(LoansService.handle_actions(request))
+
 
 @never_cache
 @login_required
 def expenses_page(request: HttpRequest) -> HttpResponse:
     """Handle Expenses page display and DataTables AJAX requests"""
-    if request.method == "POST":
-        try:
-            # Parse request parameters
-            params = DataTablesService.parse_request_params(request)
-            
-            # Base queryset with user restrictions
-            queryset = Expenses.objects.filter(deleted=False)
-            if not request.user.is_admin:
-                queryset = queryset.filter(shop=request.user.shop)
-            
-            # Apply date filtering (using legacy method for expenses)
-            start_date = request.POST.get('start_date')
-            end_date = request.POST.get('end_date')
-            queryset = ExpensesDataService.apply_date_filtering_legacy(
-                queryset, start_date, end_date
-            )
-            
-            # Prepare base data
-            base_data = ExpensesDataService.prepare_base_data(queryset)
-            total_records = len(base_data)
-            
-            # Apply sorting
-            base_data = DataTablesService.apply_sorting(
-                base_data, ExpensesDataService.COLUMN_MAPPING, 
-                params['order_column_index'], params['order_dir']
-            )
-            
-            # Apply column filtering
-            base_data = DataTablesService.apply_column_filtering(
-                base_data, request, ExpensesDataService.COLUMN_MAPPING, 
-                ExpensesDataService.COLUMN_FILTER_TYPES
-            )
-            
-            # Apply global search
-            base_data = DataTablesService.apply_global_search(base_data, params['search_value'])
-            
-            # Calculate filtered record count and grand totals
-            records_filtered = len(base_data)
-            grand_totals = ExpensesDataService.calculate_grand_totals(base_data)
-            
-            # Apply pagination
-            paginated_data = DataTablesService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            # Calculate row count start
-            row_count_start = DataTablesService.calculate_row_count_start(
-                params['start'], params['length']
-            )
-            
-            # Format final data
-            final_data = ExpensesDataService.format_final_data(paginated_data, row_count_start)
-            
-            # Prepare AJAX response
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_totals': grand_totals
-            }
-            return JsonResponse(ajax_response)
-            
-        except Exception as e:
-            logger.error(f"Error in expenses_page DataTables: {str(e)}")
-            return JsonResponse({
-                'draw': 0,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': [],
-                'error': 'Failed to load data'
-            })
-    
-    return render(request, 'miamala/expenses.html')
+    return DataTablesService.render(request, Expenses, ExpensesDataService, 'miamala/expenses.html')
 
 
 @never_cache
 @login_required
 def expenses_actions(request: HttpRequest) -> JsonResponse:
     """Handle Expenses actions (add, update, delete, view)"""
-    if request.method == 'POST':
-        try:
-            post_data = request.POST
-            expense_edit = post_data.get('expense_edit')
-            expense_delete = post_data.get('expense_delete')
-            expense_view = post_data.get('expense_view')
-            
-            # Route to appropriate service method
-            if expense_view:
-                result = ExpensesService.view_expense(expense_view)
-            elif expense_delete:
-                result = ExpensesService.delete_expense(expense_delete)
-            elif expense_edit:
-                result = ExpensesService.update_expense(post_data, expense_edit, request.user)
-            else:
-                result = ExpensesService.create_expense(post_data, request.user)
-            
-            return JsonResponse(result)
-            
-        except Exception as e:
-            logger.error(f"Error in expenses_actions: {str(e)}")
-            return JsonResponse({'success': False, 'sms': 'Operation failed..!'})
-    
-    return JsonResponse({'success': False, 'sms': 'Unknown error'})
+    return JsonResponse(ExpensesService.handle_actions(request))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shops', '0002_cart_sales_sale_items'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['shop', 'is_deleted', 'qty'], name='shops_produ_shop_id_5b43c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sales',
+            index=models.Index(fields=['shop', '-created_at'], name='shops_sales_shop_id_291818_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sales',
+            index=models.Index(fields=['-created_at'], name='shops_sales_created_2698c2_idx'),
+        ),
+    ]
@@ -1,6 +1,25 @@
 from django.db import models
 from django.utils import timezone
 
+# Managers scoping rows to the shops a user may see
+class ProductManager(models.Manager):
+    def for_user(self, user):
+        queryset = self.get_queryset()
+        return queryset if user.is_admin else queryset.filter(shop_id=user.shop_id)
+
+
+class SalesManager(models.Manager):
+    def for_user(self, user):
+        queryset = self.get_queryset()
+        return queryset if user.is_admin else queryset.filter(shop_id=user.shop_id)
+
+
+class SaleItemsManager(models.Manager):
+    def for_user(self, user):
+        queryset = self.get_queryset()
+        return queryset if user.is_admin else queryset.filter(sale__shop_id=user.shop_id)
+
+
 # shop model
 class Shop(models.Model):
     names = models.CharField(
@@ -50,10 +69,15 @@ class Product(models.Model):
     expiry_date = models.DateField(null=True, blank=True, default=None, verbose_name="Expiry Date")
     comment = models.TextField(null=True, blank=True, default=None, verbose_name="Additional Notes")
 
+    objects = ProductManager()
+
     class Meta:
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['shop', 'is_deleted', 'qty']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.shop.name})"
@@ -85,6 +109,14 @@ class Sales(models.Model):
     profit = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Profit")
     customer = models.CharField(max_length=255, default='n/a', verbose_name="Customer name")
     comment = models.TextField(null=True, blank=True, default=None)
+
+    objects = SalesManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['shop', '-created_at']),
+            models.Index(fields=['-created_at']),
+        ]
     
     def __str__(self):
         return str(self.amount)
@@ -98,6 +130,8 @@ class Sale_items(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Item price")
     qty = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Item qty")
     profit = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Sale profit")
+
+    objects = SaleItemsManager()
     
     def __str__(self):
         return str(self.product)
\ No newline at end of file
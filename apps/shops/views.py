@@ -1,25 +1,30 @@
 import logging
+from operator import itemgetter
 from django.urls import reverse
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_POST, require_GET
 from django.http import JsonResponse, HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 from django.contrib.auth.decorators import login_required
-from django.db.models import Sum, F, QuerySet
+from django.db import transaction
+from django.db.models import Count, OuterRef, Prefetch, Q, Subquery, Sum, F, QuerySet
 from django.utils import timezone
 from dateutil.parser import parse
 import zoneinfo
 from decimal import Decimal
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from .forms import ShopForm, ShopUpdateForm, ProductForm, ProductUpdateForm
 from .models import Shop, Product, Cart, Sales, Sale_items
 from apps.users.models import CustomUser
 from apps.miamala.models import Expenses, Debts, Loans, Selcompay, Lipanamba
-from utils.util_functions import admin_required, conv_timezone, filter_items, format_number
+from utils.util_functions import admin_required, conv_timezone, item_filter, format_number
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Resolved once per process instead of on every request
+_UTC = zoneinfo.ZoneInfo("UTC")
+
 # =============================================
 # SHOP MANAGEMENT SERVICES
 # =============================================
@@ -134,10 +139,11 @@ class ShopManagementService:
             if not shop:
                 return None
             
-            net_worth_aggregation = Product.objects.filter(shop=shop, is_deleted=False).aggregate(
+            product_totals = Product.objects.filter(shop=shop, is_deleted=False).aggregate(
+                items_count=Count('id'),
                 total_value=Sum(F('qty') * F('price'))
             )
-            net_worth = net_worth_aggregation['total_value'] or 0
+            net_worth = product_totals['total_value'] or 0
             
             return {
                 'id': shop.id,
@@ -146,7 +152,7 @@ class ShopManagementService:
                 'abbrev': shop.abbrev,
                 'comment': shop.comment or 'N/A',
                 'users_count': format_number(CustomUser.objects.filter(shop=shop, deleted=False, is_admin=False).count()),
-                'items_count': format_number(Product.objects.filter(shop=shop, is_deleted=False).count()),
+                'items_count': format_number(product_totals['items_count']),
                 'networth': format_number(net_worth),
                 'delete_info': False if shop.id == 1 else True
             }
@@ -251,13 +257,13 @@ class ProductManagementService:
             Dict containing success status and redirect URL
         """
         try:
-            product = ProductManagementService._get_active_product(product_id)
+            product = ProductManagementService._get_active_product(product_id, 'name')
             if not product:
                 return {'success': False, 'sms': 'Failed to delete product.'}
             
             product.is_deleted = True
             product.name = f"{product.name} (deleted)"
-            product.save()
+            product.save(update_fields=['is_deleted', 'name', 'updated_at'])
             logger.info(f"Product {product_id} deleted successfully")
             return {'success': True, 'url': reverse('products_page')}
             
@@ -277,12 +283,12 @@ class ProductManagementService:
             Dict containing success status
         """
         try:
-            product = ProductManagementService._get_active_product(product_id)
+            product = ProductManagementService._get_active_product(product_id, 'is_hidden')
             if not product:
                 return {'success': False, 'sms': 'Failed to block/unblock product.'}
             
             product.is_hidden = not product.is_hidden
-            product.save()
+            product.save(update_fields=['is_hidden', 'updated_at'])
             status = "blocked" if product.is_hidden else "unblocked"
             logger.info(f"Product {product_id} {status} successfully")
             return {'success': True}
@@ -308,13 +314,13 @@ class ProductManagementService:
             if qty_value < 1:
                 return {'success': False, 'sms': 'Quantity must be at least 1.'}
             
-            product = ProductManagementService._get_active_product(product_id)
+            product = ProductManagementService._get_active_product(product_id, 'qty')
             if not product:
                 return {'success': False, 'sms': 'Failed to update quantity.'}
             
             product.qty += qty_value
             product.restock_date = timezone.now().date()
-            product.save()
+            product.save(update_fields=['qty', 'restock_date', 'updated_at'])
             logger.info(f"Quantity updated for product {product_id}")
             return {'success': True, 'sms': 'Item stock updated.'}
             
@@ -376,10 +382,13 @@ class ProductManagementService:
             return None
 
     @staticmethod
-    def _get_active_product(product_id: int) -> Optional[Product]:
-        """Get an active (non-deleted) product by ID"""
+    def _get_active_product(product_id: int, *fields: str) -> Optional[Product]:
+        """Get an active (non-deleted) product by ID, loading only the given fields if any"""
+        queryset = Product.objects.filter(is_deleted=False)
+        if fields:
+            queryset = queryset.only(*fields)
         try:
-            return Product.objects.get(pk=product_id, is_deleted=False)
+            return queryset.get(pk=product_id)
         except Product.DoesNotExist:
             return None
 
@@ -457,10 +466,14 @@ class SalesManagementService:
             cart_item = Cart.objects.get(id=cart_id, user=user)
             cart_item.delete()
             
-            items_remaining = Cart.objects.filter(user=user)
-            cart_count = items_remaining.count()
+            # Count and total the remaining items in the database rather than loading each one
+            cart_totals = Cart.objects.filter(user=user).aggregate(
+                cart_count=Count('id'),
+                grand_total=Sum(F('product__price') * F('qty'))
+            )
+            cart_count = cart_totals['cart_count']
             cart_count_display = str(cart_count) if cart_count < 10 else '9+'
-            grand_total = sum(item.product.price * item.qty for item in items_remaining)
+            grand_total = cart_totals['grand_total'] or 0
             
             logger.info(f"Cart item {cart_id} deleted for user {user.id}")
             return {
@@ -528,26 +541,27 @@ class SalesManagementService:
             if not qty_status:
                 return {'success': False, 'sms': f'Not enough stock for: {", ".join(qty_products)}'}
             
-            sale_transaction = Sales.objects.create(
-                user=request.user,
-                amount=grand_amount,
-                customer='n/a' if not customer.strip() else customer.strip(),
-                comment=None if not comment.strip() else comment.strip(),
-                shop=list(cart_shops)[0],
-                profit=profit_count
-            )
-            
-            for item in full_cart:
-                Sale_items.objects.create(
-                    sale=sale_transaction,
-                    product=item.product,
-                    price=item.product.price,
-                    qty=item.qty,
-                    profit=(item.product.price - item.product.cost) * item.qty
+            with transaction.atomic():
+                sale_transaction = Sales.objects.create(
+                    user=request.user,
+                    amount=grand_amount,
+                    customer='n/a' if not customer.strip() else customer.strip(),
+                    comment=None if not comment.strip() else comment.strip(),
+                    shop=list(cart_shops)[0],
+                    profit=profit_count
                 )
-                item.product.qty -= item.qty
-                item.product.save()
-                item.delete()
+            
+                for item in full_cart:
+                    Sale_items.objects.create(
+                        sale=sale_transaction,
+                        product=item.product,
+                        price=item.product.price,
+                        qty=item.qty,
+                        profit=(item.product.price - item.product.cost) * item.qty
+                    )
+                    item.product.qty -= item.qty
+                    item.product.save(update_fields=['qty', 'updated_at'])
+                    item.delete()
             
             logger.info(f"Checkout completed for user {request.user.id}")
             return {'success': True, 'sms': 'Checkout completed successfully!'}
@@ -572,11 +586,12 @@ class SalesManagementService:
             sale = item.sale
             product = item.product
             
-            product.qty += item.qty
-            sale.amount -= (item.price * item.qty)
-            sale.save()
-            product.save()
-            item.delete()
+            with transaction.atomic():
+                product.qty += item.qty
+                sale.amount -= (item.price * item.qty)
+                sale.save(update_fields=['amount'])
+                product.save(update_fields=['qty', 'updated_at'])
+                item.delete()
             
             if not Sale_items.objects.filter(sale=sale).exists():
                 sale.delete()
@@ -605,13 +620,15 @@ class SalesManagementService:
             sale = Sales.objects.get(id=sale_id)
             sale_items = Sale_items.objects.filter(sale=sale)
             
-            for item in sale_items:
-                product = item.product
-                product.qty += item.qty
-                product.save()
-                item.delete()
+            with transaction.atomic():
+                for item in sale_items:
+                    product = item.product
+                    product.qty += item.qty
+                    product.save(update_fields=['qty', 'updated_at'])
+                    item.delete()
+                
+                sale.delete()
             
-            sale.delete()
             logger.info(f"Sale {sale_id} deleted successfully")
             return {'success': True, 'sales_page': reverse('sales_page')}
             
@@ -653,17 +670,29 @@ class ShopDataTablesService:
         Returns:
             List of shop data dicts
         """
+        users = CustomUser.objects.filter(
+            shop=OuterRef('pk'), deleted=False, is_admin=False
+        ).order_by().values('shop').annotate(total=Count('id')).values('total')
+        products = Product.objects.filter(
+            shop=OuterRef('pk'), is_deleted=False
+        ).order_by().values('shop')
+
+        # Counted in the same query as the shops rather than three queries per shop
+        queryset = queryset.annotate(
+            users_count=Subquery(users),
+            items_count=Subquery(products.annotate(total=Count('id')).values('total')),
+            networth=Subquery(products.annotate(total=Sum(F('qty') * F('price'))).values('total'))
+        )
+
         return [
             {
                 'id': shop.id,
                 'regdate': shop.created_at,
                 'names': shop.names,
                 'abbrev': shop.abbrev,
-                'users_count': CustomUser.objects.filter(shop=shop, deleted=False, is_admin=False).count(),
-                'items_count': Product.objects.filter(shop=shop, is_deleted=False).count(),
-                'networth': Product.objects.filter(shop=shop, is_deleted=False).aggregate(
-                    total_value=Sum(F('qty') * F('price'))
-                )['total_value'] or 0,
+                'users_count': shop.users_count or 0,
+                'items_count': shop.items_count or 0,
+                'networth': shop.networth or 0,
                 'info': reverse('shop_details', kwargs={'shopid': shop.id})
             }
             for shop in queryset
@@ -688,14 +717,14 @@ class ShopDataTablesService:
         return [
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'regdate': conv_timezone(item.get('regdate'), '%d-%b-%Y'),
-                'names': item.get('names'),
-                'abbrev': item.get('abbrev'),
-                'users_count': format_number(item.get('users_count')),
-                'items_count': format_number(item.get('items_count', 0)),
-                'networth': format_number(item.get('networth', 0)) + " TZS",
-                'info': item.get('info')
+                'id': item['id'],
+                'regdate': conv_timezone(item['regdate'], '%d-%b-%Y'),
+                'names': item['names'],
+                'abbrev': item['abbrev'],
+                'users_count': format_number(item['users_count']),
+                'items_count': format_number(item['items_count']),
+                'networth': format_number(item['networth']) + " TZS",
+                'info': item['info']
             }
             for i, item in enumerate(data)
         ]
@@ -732,28 +761,33 @@ class ProductDataTablesService:
         Returns:
             List of product data dicts
         """
+        # Plain value rows straight from the cursor; no Product instances are built
+        rows = queryset.values(
+            'id', 'name', 'shop__abbrev', 'qty', 'cost', 'price', 'is_hidden', 'expiry_date'
+        ).iterator()
+        today = timezone.now().date()
         return [
             {
-                'id': item.id,
-                'name': item.name,
-                'shop': item.shop.abbrev,
-                'qty': item.qty,
-                'cost': item.cost,
-                'price': item.price,
-                'status': ProductDataTablesService._get_product_status(item),
-                'info': reverse('product_details', kwargs={'itemid': item.id})
+                'id': item['id'],
+                'name': item['name'],
+                'shop': item['shop__abbrev'],
+                'qty': item['qty'],
+                'cost': item['cost'],
+                'price': item['price'],
+                'status': ProductDataTablesService._get_product_status(item, today),
+                'info': reverse('product_details', kwargs={'itemid': item['id']})
             }
-            for item in queryset
+            for item in rows
         ]
 
     @staticmethod
-    def _get_product_status(item: Product) -> str:
+    def _get_product_status(item: Dict[str, Any], today) -> str:
         """Determine product status based on quantity, visibility, and expiry"""
-        if item.qty == 0:
+        if item['qty'] == 0:
             return "SoldOut"
-        if item.is_hidden:
+        if item['is_hidden']:
             return "Blocked"
-        if item.expiry_date and item.expiry_date <= timezone.now().date():
+        if item['expiry_date'] and item['expiry_date'] <= today:
             return "Expired"
         return "Active"
 
@@ -776,14 +810,14 @@ class ProductDataTablesService:
         return [
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'name': item.get('name'),
-                'shop': item.get('shop'),
-                'qty': format_number(item.get('qty')),
-                'cost': format_number(item.get('cost')) + " TZS",
-                'price': format_number(item.get('price')) + " TZS",
-                'status': item.get('status'),
-                'info': item.get('info')
+                'id': item['id'],
+                'name': item['name'],
+                'shop': item['shop'],
+                'qty': format_number(item['qty']),
+                'cost': format_number(item['cost']) + " TZS",
+                'price': format_number(item['price']) + " TZS",
+                'status': item['status'],
+                'info': item['info']
             }
             for i, item in enumerate(data)
         ]
@@ -815,17 +849,25 @@ class SalesDataTablesService:
         Returns:
             List of sales data dicts
         """
+        # One query for the user's cart; the first row per product matches the old .first() under Meta.ordering
+        cart_qty = {}
+        for product_id, qty in Cart.objects.filter(user=user).values_list('product_id', 'qty'):
+            cart_qty.setdefault(product_id, qty)
+        
+        # Expired products are dropped in SQL and the rest read as plain value rows
+        today = timezone.now().date()
+        rows = queryset.filter(
+            Q(expiry_date__isnull=True) | Q(expiry_date__gt=today)
+        ).values('id', 'name', 'qty', 'price').iterator()
         return [
             {
-                'id': product.id,
-                'name': product.name,
-                'qty': product.qty,
-                'price': product.price,
-                'cart': Cart.objects.filter(user=user, product=product).first().qty
-                if Cart.objects.filter(user=user, product=product).exists() else 0
+                'id': product['id'],
+                'name': product['name'],
+                'qty': product['qty'],
+                'price': product['price'],
+                'cart': cart_qty.get(product['id'], 0)
             }
-            for product in queryset
-            if product.expiry_date is None or product.expiry_date > timezone.now().date()
+            for product in rows
         ]
 
     @staticmethod
@@ -847,12 +889,12 @@ class SalesDataTablesService:
         return [
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'name': item.get('name'),
-                'qty': format_number(item.get('qty')),
-                'price': format_number(item.get('price')) + " TZS",
-                'sell_qty': format_number(item.get('qty')),
-                'cart': format_number(item.get('cart')),
+                'id': item['id'],
+                'name': item['name'],
+                'qty': format_number(item['qty']),
+                'price': format_number(item['price']) + " TZS",
+                'sell_qty': format_number(item['qty']),
+                'cart': format_number(item['cart']),
                 'action': ''
             }
             for i, item in enumerate(data)
@@ -906,10 +948,12 @@ class SalesReportDataTablesService:
                         'qty': format_number(item.qty),
                         'total': format_number(item.price * item.qty) + " TZS"
                     }
-                    for idx, item in enumerate(Sale_items.objects.filter(sale=sale))
+                    for idx, item in enumerate(sale.sales.all())
                 ]
             }
-            for sale in queryset
+            for sale in queryset.select_related('shop', 'user').prefetch_related(
+                Prefetch('sales', queryset=Sale_items.objects.select_related('product').order_by('id'))
+            )
         ]
 
     @staticmethod
@@ -931,14 +975,14 @@ class SalesReportDataTablesService:
         return [
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'saledate': conv_timezone(item.get('saledate'), '%d-%b-%Y %H:%M:%S'),
-                'shop': item.get('shop'),
-                'user': item.get('user'),
-                'customer': item.get('customer'),
-                'amount': format_number(item.get('amount')) + " TZS",
-                'profit': format_number(item.get('profit')) + " TZS",
-                'items': item.get('sale_items')
+                'id': item['id'],
+                'saledate': conv_timezone(item['saledate'], '%d-%b-%Y %H:%M:%S'),
+                'shop': item['shop'],
+                'user': item['user'],
+                'customer': item['customer'],
+                'amount': format_number(item['amount']) + " TZS",
+                'profit': format_number(item['profit']) + " TZS",
+                'items': item['sale_items']
             }
             for i, item in enumerate(data)
         ]
@@ -977,19 +1021,24 @@ class SalesItemsReportDataTablesService:
         Returns:
             List of sale items data dicts
         """
+        # Plain dict rows straight from the cursor instead of three model instances per item
+        rows = queryset.values(
+            'id', 'sale__created_at', 'sale__shop__abbrev', 'product__name', 'price', 'qty', 'profit',
+            'sale__user__username', 'sale__user__deleted'
+        ).iterator()
         return [
             {
-                'id': item.id,
-                'saledate': item.sale.created_at,
-                'shop': item.sale.shop.abbrev,
-                'product': item.product.name,
-                'price': item.price,
-                'qty': item.qty,
-                'amount': item.price * item.qty,
-                'profit': item.profit,
-                'user': item.sale.user.username if not item.sale.user.deleted else f"{item.sale.user.username} (deleted)"
+                'id': row['id'],
+                'saledate': row['sale__created_at'],
+                'shop': row['sale__shop__abbrev'],
+                'product': row['product__name'],
+                'price': row['price'],
+                'qty': row['qty'],
+                'amount': row['price'] * row['qty'],
+                'profit': row['profit'],
+                'user': row['sale__user__username'] if not row['sale__user__deleted'] else f"{row['sale__user__username']} (deleted)"
             }
-            for item in queryset
+            for row in rows
         ]
 
     @staticmethod
@@ -1011,15 +1060,15 @@ class SalesItemsReportDataTablesService:
         return [
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'saledate': conv_timezone(item.get('saledate'), '%d-%b-%Y %H:%M:%S'),
-                'shop': item.get('shop'),
-                'product': item.get('product'),
-                'price': format_number(item.get('price')) + " TZS",
-                'qty': format_number(item.get('qty')),
-                'amount': format_number(item.get('amount')) + " TZS",
-                'profit': format_number(item.get('profit')) + " TZS",
-                'user': item.get('user')
+                'id': item['id'],
+                'saledate': conv_timezone(item['saledate'], '%d-%b-%Y %H:%M:%S'),
+                'shop': item['shop'],
+                'product': item['product'],
+                'price': format_number(item['price']) + " TZS",
+                'qty': format_number(item['qty']),
+                'amount': format_number(item['amount']) + " TZS",
+                'profit': format_number(item['profit']) + " TZS",
+                'user': item['user']
             }
             for i, item in enumerate(data)
         ]
@@ -1038,15 +1087,16 @@ class DataTablesBaseService:
         Returns:
             Dict containing parsed parameters
         """
+        get = request.POST.get
         return {
-            'draw': int(request.POST.get('draw', 0)),
-            'start': int(request.POST.get('start', 0)),
-            'length': int(request.POST.get('length', 10)),
-            'search_value': request.POST.get('search[value]', ''),
-            'order_column_index': int(request.POST.get('order[0][column]', 0)),
-            'order_dir': request.POST.get('order[0][dir]', 'asc'),
-            'start_date_str': request.POST.get('startdate'),
-            'end_date_str': request.POST.get('enddate')
+            'draw': int(get('draw', 0)),
+            'start': int(get('start', 0)),
+            'length': int(get('length', 10)) or 10,
+            'search_value': get('search[value]', ''),
+            'order_column_index': int(get('order[0][column]', 0)),
+            'order_dir': get('order[0][dir]', 'asc'),
+            'start_date_str': get('startdate'),
+            'end_date_str': get('enddate')
         }
 
     @staticmethod
@@ -1067,10 +1117,10 @@ class DataTablesBaseService:
             parsed_end_date = None
             
             if start_date_str:
-                parsed_start_date = parse(start_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_start_date = parse(start_date_str).astimezone(_UTC)
             
             if end_date_str:
-                parsed_end_date = parse(end_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_end_date = parse(end_date_str).astimezone(_UTC)
             
             if parsed_start_date and parsed_end_date:
                 return queryset.filter(created_at__range=(parsed_start_date, parsed_end_date))
@@ -1096,19 +1146,23 @@ class DataTablesBaseService:
             column_mapping: Mapping of column indices to field names
             
         Returns:
-            Sorted data list
+            The same list, sorted in place
         """
-        order_column_name = column_mapping.get(order_column_index, list(column_mapping.values())[0])
+        order_column_name = column_mapping.get(order_column_index) or next(iter(column_mapping.values()))
         reverse_order = order_dir != 'asc'
+        sort_key = itemgetter(order_column_name)
         
-        def none_safe_sort(item):
-            value = item.get(order_column_name)
-            return (value is None, value)
+        # The C-level itemgetter key is enough unless the column holds None values
+        if None in map(sort_key, data):
+            def sort_key(item):
+                value = item[order_column_name]
+                return (value is None, value)
         
-        return sorted(data, key=none_safe_sort, reverse=reverse_order)
+        data.sort(key=sort_key, reverse=reverse_order)
+        return data
 
     @staticmethod
-    def apply_column_filtering(data: List[Dict], request: HttpRequest, column_mapping: Dict, column_filter_types: Dict) -> List[Dict]:
+    def apply_column_filtering(data: List[Dict], request: HttpRequest, column_mapping: Dict, column_filter_types: Dict) -> Iterable[Dict]:
         """
         Apply individual column filtering
         
@@ -1119,42 +1173,51 @@ class DataTablesBaseService:
             column_filter_types: Mapping of field names to filter types
             
         Returns:
-            Filtered data list
+            The data unchanged, or a lazy filter over it for the search step to materialise
         """
-        filtered_data = data
-        
+        active_filters = []
         for i in range(len(column_mapping)):
             column_search = request.POST.get(f'columns[{i}][search][value]', '')
-            if column_search:
-                column_field = column_mapping.get(i)
-                if column_field:
-                    filter_type = column_filter_types.get(column_field, 'contains')
-                    filtered_data = [
-                        item for item in filtered_data
-                        if filter_items(column_field, column_search, item, filter_type)
-                    ]
+            column_field = column_mapping.get(i)
+            if column_search and column_field:
+                filter_type = column_filter_types.get(column_field, 'contains')
+                active_filters.append(item_filter(column_field, column_search, filter_type))
         
-        return filtered_data
+        if not active_filters:
+            return data
+        
+        # Single pass over the rows, applying every active column filter to each
+        return (
+            item for item in data
+            if all(matches(item) for matches in active_filters)
+        )
 
     @staticmethod
-    def apply_global_search(data: List[Dict], search_value: str) -> List[Dict]:
+    def apply_global_search(data: Iterable[Dict], search_value: str) -> List[Dict]:
         """
         Apply global search filtering
         
         Args:
-            data: List of data dicts
+            data: Data dicts, possibly a lazy column filter
             search_value: Search term
             
         Returns:
             Filtered data list
         """
         if not search_value:
-            return data
+            return data if isinstance(data, list) else list(data)
         
+        # One haystack per row; the separator keeps matches within a single field
         search_lower = search_value.lower()
+        if search_lower.upper() == search_lower:
+            # Nothing to case-fold (amounts, phone numbers, dates), so skip lowering every row
+            return [
+                item for item in data
+                if search_lower in '\x1f'.join(map(str, item.values()))
+            ]
         return [
             item for item in data
-            if any(str(value).lower().find(search_lower) != -1 for value in item.values())
+            if search_lower in '\x1f'.join(map(str, item.values())).lower()
         ]
 
     @staticmethod
@@ -1174,6 +1237,72 @@ class DataTablesBaseService:
             return data
         return data[start:start + length]
 
+    @staticmethod
+    def sum_columns(data: List[Dict], fields: List[str]) -> List[Any]:
+        """
+        Total several columns in a single pass over the rows
+        
+        Args:
+            data: List of data dicts
+            fields: Names of the columns to total
+            
+        Returns:
+            Column totals, in the order of fields
+        """
+        totals = [0] * len(fields)
+        for item in data:
+            for i, field in enumerate(fields):
+                totals[i] += item[field]
+        return totals
+
+    @staticmethod
+    def build_response(request: HttpRequest, params: Dict[str, Any], base_data: List[Dict],
+                       table_service: type, total_fields: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Filter, search, sort and page prepared rows into a DataTables response
+        
+        Args:
+            request: HTTP request object
+            params: Parsed DataTables parameters
+            base_data: Rows prepared by the table service
+            table_service: Table service providing COLUMN_MAPPING, COLUMN_FILTER_TYPES and format_final_data
+            total_fields: Optional mapping of response keys to the columns totalled into them
+            
+        Returns:
+            Dict ready to be sent as the DataTables JSON response
+        """
+        total_records = len(base_data)
+        
+        base_data = DataTablesBaseService.apply_column_filtering(
+            base_data, request, table_service.COLUMN_MAPPING,
+            table_service.COLUMN_FILTER_TYPES
+        )
+        
+        base_data = DataTablesBaseService.apply_global_search(base_data, params['search_value'])
+        records_filtered = len(base_data)
+        
+        base_data = DataTablesBaseService.apply_sorting(
+            base_data, params['order_column_index'], params['order_dir'],
+            table_service.COLUMN_MAPPING
+        )
+        
+        totals = {}
+        if total_fields:
+            sums = DataTablesBaseService.sum_columns(base_data, list(total_fields.values()))
+            totals = {key: format_number(total) + " TZS" for key, total in zip(total_fields, sums)}
+        
+        paginated_data = DataTablesBaseService.paginate_data(
+            base_data, params['start'], params['length']
+        )
+        
+        return {
+            'draw': params['draw'],
+            'recordsTotal': total_records,
+            'recordsFiltered': records_filtered,
+            'data': table_service.format_final_data(paginated_data, params['start'], params['length']),
+            **totals
+        }
+
 # =============================================
 # VIEW FUNCTIONS
 # =============================================
@@ -1233,36 +1362,8 @@ def shops_page(request: HttpRequest) -> HttpResponse:
             )
             
             base_data = ShopDataTablesService.prepare_shop_data(queryset)
-            total_records = len(base_data)
-            
-            base_data = DataTablesBaseService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir'],
-                ShopDataTablesService.COLUMN_MAPPING
-            )
-            
-            base_data = DataTablesBaseService.apply_column_filtering(
-                base_data, request, ShopDataTablesService.COLUMN_MAPPING,
-                ShopDataTablesService.COLUMN_FILTER_TYPES
-            )
             
-            base_data = DataTablesBaseService.apply_global_search(base_data, params['search_value'])
-            records_filtered = len(base_data)
-            
-            paginated_data = DataTablesBaseService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            final_data = ShopDataTablesService.format_final_data(
-                paginated_data, params['start'], params['length']
-            )
-            
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data
-            }
-            return JsonResponse(ajax_response)
+            return JsonResponse(DataTablesBaseService.build_response(request, params, base_data, ShopDataTablesService))
             
         except Exception as e:
             logger.error(f"Error in shops_page DataTables: {str(e)}")
@@ -1325,36 +1426,8 @@ def products_page(request: HttpRequest) -> HttpResponse:
             queryset = Product.objects.filter(is_deleted=False)
             
             base_data = ProductDataTablesService.prepare_product_data(queryset)
-            total_records = len(base_data)
-            
-            base_data = DataTablesBaseService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir'],
-                ProductDataTablesService.COLUMN_MAPPING
-            )
-            
-            base_data = DataTablesBaseService.apply_column_filtering(
-                base_data, request, ProductDataTablesService.COLUMN_MAPPING,
-                ProductDataTablesService.COLUMN_FILTER_TYPES
-            )
-            
-            base_data = DataTablesBaseService.apply_global_search(base_data, params['search_value'])
-            records_filtered = len(base_data)
-            
-            paginated_data = DataTablesBaseService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            final_data = ProductDataTablesService.format_final_data(
-                paginated_data, params['start'], params['length']
-            )
             
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data
-            }
-            return JsonResponse(ajax_response)
+            return JsonResponse(DataTablesBaseService.build_response(request, params, base_data, ProductDataTablesService))
             
         except Exception as e:
             logger.error(f"Error in products_page DataTables: {str(e)}")
@@ -1451,41 +1524,11 @@ def sales_page(request: HttpRequest) -> HttpResponse:
     if request.method == 'POST':
         try:
             params = DataTablesBaseService.parse_datatables_request(request)
-            queryset = Product.objects.filter(is_deleted=False, is_hidden=False, qty__gt=0)
-            if not request.user.is_admin:
-                queryset = queryset.filter(shop=request.user.shop)
+            queryset = Product.objects.for_user(request.user).filter(is_deleted=False, is_hidden=False, qty__gt=0)
             
             base_data = SalesDataTablesService.prepare_sales_data(queryset, request.user)
-            total_records = len(base_data)
             
-            base_data = DataTablesBaseService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir'],
-                SalesDataTablesService.COLUMN_MAPPING
-            )
-            
-            base_data = DataTablesBaseService.apply_column_filtering(
-                base_data, request, SalesDataTablesService.COLUMN_MAPPING,
-                SalesDataTablesService.COLUMN_FILTER_TYPES
-            )
-            
-            base_data = DataTablesBaseService.apply_global_search(base_data, params['search_value'])
-            records_filtered = len(base_data)
-            
-            paginated_data = DataTablesBaseService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            final_data = SalesDataTablesService.format_final_data(
-                paginated_data, params['start'], params['length']
-            )
-            
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data
-            }
-            return JsonResponse(ajax_response)
+            return JsonResponse(DataTablesBaseService.build_response(request, params, base_data, SalesDataTablesService))
             
         except Exception as e:
             logger.error(f"Error in sales_page DataTables: {str(e)}")
@@ -1497,7 +1540,7 @@ def sales_page(request: HttpRequest) -> HttpResponse:
                 'error': 'Failed to load data'
             })
     
-    cart = Cart.objects.filter(user=request.user).order_by('id')
+    cart = Cart.objects.filter(user=request.user).select_related('product').order_by('id')
     grand_total = sum(item.product.price * item.qty for item in cart)
     cart_items = [
         {
@@ -1578,48 +1621,18 @@ def sales_report(request: HttpRequest) -> HttpResponse:
     if request.method == 'POST':
         try:
             params = DataTablesBaseService.parse_datatables_request(request)
-            queryset = Sales.objects.all() if request.user.is_admin else Sales.objects.filter(shop=request.user.shop)
+            queryset = Sales.objects.for_user(request.user)
             
             queryset = DataTablesBaseService.apply_date_filtering(
                 queryset, params['start_date_str'], params['end_date_str']
             )
             
             base_data = SalesReportDataTablesService.prepare_sales_report_data(queryset)
-            total_records = len(base_data)
-            
-            base_data = DataTablesBaseService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir'],
-                SalesReportDataTablesService.COLUMN_MAPPING
-            )
             
-            base_data = DataTablesBaseService.apply_column_filtering(
-                base_data, request, SalesReportDataTablesService.COLUMN_MAPPING,
-                SalesReportDataTablesService.COLUMN_FILTER_TYPES
-            )
-            
-            base_data = DataTablesBaseService.apply_global_search(base_data, params['search_value'])
-            records_filtered = len(base_data)
-            
-            grand_total_amount = sum(sale['amount'] for sale in base_data)
-            grand_total_profit = sum(sale['profit'] for sale in base_data)
-            
-            paginated_data = DataTablesBaseService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            final_data = SalesReportDataTablesService.format_final_data(
-                paginated_data, params['start'], params['length']
-            )
-            
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_total': format_number(grand_total_amount) + " TZS",
-                'grand_profit': format_number(grand_total_profit) + " TZS"
-            }
-            return JsonResponse(ajax_response)
+            return JsonResponse(DataTablesBaseService.build_response(
+                request, params, base_data, SalesReportDataTablesService,
+                {'grand_total': 'amount', 'grand_profit': 'profit'}
+            ))
             
         except Exception as e:
             logger.error(f"Error in sales_report DataTables: {str(e)}")
@@ -1649,48 +1662,18 @@ def sales_items_report(request: HttpRequest) -> HttpResponse:
     if request.method == 'POST':
         try:
             params = DataTablesBaseService.parse_datatables_request(request)
-            queryset = Sale_items.objects.all() if request.user.is_admin else Sale_items.objects.filter(sale__shop=request.user.shop)
+            queryset = Sale_items.objects.for_user(request.user)
             
             queryset = DataTablesBaseService.apply_date_filtering(
                 queryset, params['start_date_str'], params['end_date_str']
             )
             
             base_data = SalesItemsReportDataTablesService.prepare_sales_items_data(queryset)
-            total_records = len(base_data)
-            
-            base_data = DataTablesBaseService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir'],
-                SalesItemsReportDataTablesService.COLUMN_MAPPING
-            )
-            
-            base_data = DataTablesBaseService.apply_column_filtering(
-                base_data, request, SalesItemsReportDataTablesService.COLUMN_MAPPING,
-                SalesItemsReportDataTablesService.COLUMN_FILTER_TYPES
-            )
-            
-            base_data = DataTablesBaseService.apply_global_search(base_data, params['search_value'])
-            records_filtered = len(base_data)
             
-            grand_total_amount = sum(item['amount'] for item in base_data)
-            grand_total_profit = sum(item['profit'] for item in base_data)
-            
-            paginated_data = DataTablesBaseService.paginate_data(
-                base_data, params['start'], params['length']
-            )
-            
-            final_data = SalesItemsReportDataTablesService.format_final_data(
-                paginated_data, params['start'], params['length']
-            )
-            
-            ajax_response = {
-                'draw': params['draw'],
-                'recordsTotal': total_records,
-                'recordsFiltered': records_filtered,
-                'data': final_data,
-                'grand_total': format_number(grand_total_amount) + " TZS",
-                'grand_profit': format_number(grand_total_profit) + " TZS"
-            }
-            return JsonResponse(ajax_response)
+            return JsonResponse(DataTablesBaseService.build_response(
+                request, params, base_data, SalesItemsReportDataTablesService,
+                {'grand_total': 'amount', 'grand_profit': 'profit'}
+            ))
             
         except Exception as e:
             logger.error(f"Error in sales_items_report DataTables: {str(e)}")
@@ -6,6 +6,10 @@ from django.utils.translation import gettext_lazy as _
 
 
 class CustomUserManager(BaseUserManager):
+    def for_user(self, user):
+        queryset = self.get_queryset()
+        return queryset if user.is_admin else queryset.filter(shop_id=user.shop_id)
+
     def create_user(self, username, fullname, shop, phone=None, password=None, is_admin=False, **extra_fields):
         if not username:
             raise ValueError(_("The username field cannot be blank"))
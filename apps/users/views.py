@@ -1,6 +1,7 @@
 import logging
 import zoneinfo
-from typing import Dict, Any, Optional, List
+from operator import itemgetter
+from typing import Dict, Any, Iterable, Optional, List
 from django.urls import reverse
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_POST
@@ -14,11 +15,14 @@ from dateutil.parser import parse
 from .forms import LoginForm, UserRegistrationForm, UserUpdateForm
 from .models import CustomUser
 from apps.shops.models import Shop, Sales, Cart
-from utils.util_functions import admin_required, format_phone, conv_timezone, filter_items, format_number
+from utils.util_functions import admin_required, format_phone, conv_timezone, item_filter, format_number
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Resolved once per process instead of on every request
+_UTC = zoneinfo.ZoneInfo("UTC")
+
 
 # =============================================
 # USER MANAGEMENT SERVICES
@@ -109,7 +113,7 @@ class UserManagementService:
             
             # Soft delete the user
             user.deleted = True
-            user.save()
+            user.save(update_fields=['deleted', 'updated_at'])
             
             logger.info(f"User {user_id} deleted successfully")
             return {'success': True, 'url': reverse('users_page')}
@@ -135,7 +139,7 @@ class UserManagementService:
                 return {'success': False}
             
             user.is_active = not user.is_active
-            user.save()
+            user.save(update_fields=['is_active', 'updated_at'])
             
             status = "activated" if user.is_active else "deactivated"
             logger.info(f"User {user_id} {status} successfully")
@@ -164,7 +168,7 @@ class UserManagementService:
             # Set password to uppercase username
             new_password = user.username.upper()
             user.set_password(new_password)
-            user.save()
+            user.save(update_fields=['password', 'updated_at'])
             
             logger.info(f"Password reset for user {user_id}")
             return {'success': True}
@@ -301,7 +305,7 @@ class AuthenticationService:
                 }
             
             user.phone = new_contact
-            user.save()
+            user.save(update_fields=['phone', 'updated_at'])
             
             logger.info(f"Contact updated for user {user.id}")
             return {'success': True, 'sms': 'Contact updated successfully'}
@@ -342,7 +346,7 @@ class AuthenticationService:
             
             # Update password
             user.set_password(new_password)
-            user.save()
+            user.save(update_fields=['password', 'updated_at'])
             
             logger.info(f"Password changed for user {user.id}")
             return {'success': True, 'sms': 'Password changed successfully'}
@@ -387,15 +391,16 @@ class DataTablesService:
         Returns:
             Dict containing parsed parameters
         """
+        get = request.POST.get
         return {
-            'draw': int(request.POST.get('draw', 0)),
-            'start': int(request.POST.get('start', 0)),
-            'length': int(request.POST.get('length', 10)),
-            'search_value': request.POST.get('search[value]', ''),
-            'order_column_index': int(request.POST.get('order[0][column]', 0)),
-            'order_dir': request.POST.get('order[0][dir]', 'asc'),
-            'start_date_str': request.POST.get('startdate'),
-            'end_date_str': request.POST.get('enddate'),
+            'draw': int(get('draw', 0)),
+            'start': int(get('start', 0)),
+            'length': int(get('length', 10)) or 10,
+            'search_value': get('search[value]', ''),
+            'order_column_index': int(get('order[0][column]', 0)),
+            'order_dir': get('order[0][dir]', 'asc'),
+            'start_date_str': get('startdate'),
+            'end_date_str': get('enddate'),
         }
     
     @staticmethod
@@ -416,10 +421,10 @@ class DataTablesService:
             parsed_end_date = None
             
             if start_date_str:
-                parsed_start_date = parse(start_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_start_date = parse(start_date_str).astimezone(_UTC)
             
             if end_date_str:
-                parsed_end_date = parse(end_date_str).astimezone(zoneinfo.ZoneInfo("UTC"))
+                parsed_end_date = parse(end_date_str).astimezone(_UTC)
             
             if parsed_start_date and parsed_end_date:
                 return queryset.filter(created_at__range=(parsed_start_date, parsed_end_date))
@@ -444,18 +449,22 @@ class DataTablesService:
         Returns:
             List of user data dicts
         """
+        # Plain dict rows straight from the cursor instead of model instances
+        rows = queryset.values(
+            'id', 'created_at', 'fullname', 'username', 'shop__abbrev', 'phone', 'is_active'
+        ).iterator()
         return [
             {
-                'id': user.id,
-                'regdate': user.created_at,
-                'fullname': user.fullname,
-                'username': user.username,
-                'shop': user.shop.abbrev,
-                'phone': user.phone if user.phone else "N/A",
-                'status': "active" if user.is_active else "inactive",
-                'info': reverse('user_details', kwargs={'userid': int(user.id)})
+                'id': row['id'],
+                'regdate': row['created_at'],
+                'fullname': row['fullname'],
+                'username': row['username'],
+                'shop': row['shop__abbrev'],
+                'phone': row['phone'] if row['phone'] else "N/A",
+                'status': "active" if row['is_active'] else "inactive",
+                'info': reverse('user_details', kwargs={'userid': int(row['id'])})
             }
-            for user in queryset
+            for row in rows
         ]
     
     @staticmethod
@@ -469,15 +478,16 @@ class DataTablesService:
             order_dir: Sort direction ('asc' or 'desc')
             
         Returns:
-            Sorted data list
+            The same list, sorted in place
         """
         order_column_name = DataTablesService.USER_COLUMN_MAPPING.get(order_column_index, 'regdate')
         reverse_order = order_dir != 'asc'
         
-        return sorted(data, key=lambda x: x[order_column_name], reverse=reverse_order)
+        data.sort(key=itemgetter(order_column_name), reverse=reverse_order)
+        return data
     
     @staticmethod
-    def apply_column_filtering(data: List[Dict], request: HttpRequest) -> List[Dict]:
+    def apply_column_filtering(data: List[Dict], request: HttpRequest) -> Iterable[Dict]:
         """
         Apply individual column filtering
         
@@ -486,42 +496,51 @@ class DataTablesService:
             request: HTTP request object
             
         Returns:
-            Filtered data list
+            The data unchanged, or a lazy filter over it for the search step to materialise
         """
-        filtered_data = data
-        
+        active_filters = []
         for i in range(len(DataTablesService.USER_COLUMN_MAPPING)):
             column_search = request.POST.get(f'columns[{i}][search][value]', '')
-            if column_search:
-                column_field = DataTablesService.USER_COLUMN_MAPPING.get(i)
-                if column_field:
-                    filter_type = DataTablesService.COLUMN_FILTER_TYPES.get(column_field, 'contains')
-                    filtered_data = [
-                        item for item in filtered_data 
-                        if filter_items(column_field, column_search, item, filter_type)
-                    ]
-        
-        return filtered_data
+            column_field = DataTablesService.USER_COLUMN_MAPPING.get(i)
+            if column_search and column_field:
+                filter_type = DataTablesService.COLUMN_FILTER_TYPES.get(column_field, 'contains')
+                active_filters.append(item_filter(column_field, column_search, filter_type))
+        
+        if not active_filters:
+            return data
+        
+        # Single pass over the rows, applying every active column filter to each
+        return (
+            item for item in data
+            if all(matches(item) for matches in active_filters)
+        )
     
     @staticmethod
-    def apply_global_search(data: List[Dict], search_value: str) -> List[Dict]:
+    def apply_global_search(data: Iterable[Dict], search_value: str) -> List[Dict]:
         """
         Apply global search filtering
         
         Args:
-            data: List of data dicts
+            data: Data dicts, possibly a lazy column filter
             search_value: Search term
             
         Returns:
             Filtered data list
         """
         if not search_value:
-            return data
+            return data if isinstance(data, list) else list(data)
         
+        # One haystack per row; the separator keeps matches within a single field
         search_lower = search_value.lower()
+        if search_lower.upper() == search_lower:
+            # Nothing to case-fold (amounts, phone numbers, dates), so skip lowering every row
+            return [
+                item for item in data
+                if search_lower in '\x1f'.join(map(str, item.values()))
+            ]
         return [
-            item for item in data 
-            if any(str(value).lower().find(search_lower) != -1 for value in item.values())
+            item for item in data
+            if search_lower in '\x1f'.join(map(str, item.values())).lower()
         ]
     
     @staticmethod
@@ -560,14 +579,14 @@ class DataTablesService:
         return [
             {
                 'count': row_count_start + i,
-                'id': item.get('id'),
-                'regdate': conv_timezone(item.get('regdate'), '%d-%b-%Y'),
-                'fullname': item.get('fullname'),
-                'username': item.get('username'),
-                'shop': item.get('shop'),
-                'phone': format_phone(item.get('phone')),
-                'status': item.get('status'),
-                'info': item.get('info'),
+                'id': item['id'],
+                'regdate': conv_timezone(item['regdate'], '%d-%b-%Y'),
+                'fullname': item['fullname'],
+                'username': item['username'],
+                'shop': item['shop'],
+                'phone': format_phone(item['phone']),
+                'status': item['status'],
+                'info': item['info'],
             }
             for i, item in enumerate(data)
         ]
@@ -639,11 +658,6 @@ def users_page(request: HttpRequest) -> HttpResponse:
             base_data = DataTablesService.prepare_user_data(queryset)
             total_records = len(base_data)
             
-            # Apply sorting
-            base_data = DataTablesService.apply_sorting(
-                base_data, params['order_column_index'], params['order_dir']
-            )
-            
             # Apply column filtering
             base_data = DataTablesService.apply_column_filtering(base_data, request)
             
@@ -653,6 +667,11 @@ def users_page(request: HttpRequest) -> HttpResponse:
             # Calculate filtered record count
             records_filtered = len(base_data)
             
+            # Apply sorting
+            base_data = DataTablesService.apply_sorting(
+                base_data, params['order_column_index'], params['order_dir']
+            )
+            
             # Apply pagination
             paginated_data = DataTablesService.paginate_data(
                 base_data, params['start'], params['length']
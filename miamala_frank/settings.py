@@ -67,6 +67,15 @@ DATABASES = {
     }
 }
 
+# Shared by every worker process, so cache invalidation on save reaches them all
+# (the table is created by the dashboard migrations)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
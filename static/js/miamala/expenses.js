@@ -495,7 +495,7 @@ class ExpensesManager {
       { data: "amount" },
       { data: "user" },
       { data: "shop" },
-      { data: "action" },
+      { data: null, defaultContent: "" },
     ];
   }
 
@@ -398,7 +398,7 @@ class LipaNambaManager {
       { data: "profit" },
       { data: "shop" },
       { data: "user" },
-      { data: "action" },
+      { data: null, defaultContent: "" },
     ];
   }
 
@@ -455,7 +455,7 @@ class LoansManager {
       { data: "balance" },
       { data: "shop" },
       { data: "user" },
-      { data: "action" },
+      { data: null, defaultContent: "" },
     ];
   }
 
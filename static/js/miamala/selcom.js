@@ -396,7 +396,7 @@ class SelcomManager {
       { data: "profit" },
       { data: "shop" },
       { data: "user" },
-      { data: "action" },
+      { data: null, defaultContent: "" },
     ];
   }
 
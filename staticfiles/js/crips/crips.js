@@ -5,6 +5,7 @@ class CripsManager {
       dateCache: { start: null, end: null },
       csrfToken: this.getCSRFToken(),
       deletingState: false,
+      cursor: null,
     };
 
     this.selectors = {
@@ -273,10 +274,14 @@ class CripsManager {
         const dateRange = this.getDateRange();
         d.startdate = dateRange.start;
         d.enddate = dateRange.end;
+        this.applyCursor(d);
       },
       dataType: "json",
       headers: { "X-CSRFToken": this.config.csrfToken },
       dataSrc: (json) => {
+        this.config.cursor = json.cursor
+          ? { ...json.cursor, next: this.pendingCursorKey }
+          : null;
         $(`${this.selectors.table} tfoot tr:eq(1) th:eq(5)`)
           .html(json.grand_total)
           .addClass("text-end pe-3");
@@ -285,6 +290,27 @@ class CripsManager {
     };
   }
 
+  /**
+   * Attach the keyset cursor when the request is the page right after the
+   * last one loaded with the same ordering, search and filters.
+   */
+  applyCursor(d) {
+    const signature = JSON.stringify([
+      d.order,
+      d.search,
+      d.columns.map((col) => col.search.value),
+      d.startdate,
+      d.enddate,
+      d.length,
+    ]);
+    const cursor = this.config.cursor;
+    if (cursor && cursor.next === `${signature}|${d.start}`) {
+      d.last_created_at = cursor.last_created_at;
+      d.last_id = cursor.last_id;
+    }
+    this.pendingCursorKey = `${signature}|${d.start + d.length}`;
+  }
+
   /**
    * Get column configuration
    */
@@ -470,7 +470,7 @@ class DebtsManager {
         { data: "balance" },
         { data: "shop" },
         { data: "user" },
-        { data: "action" },
+        { data: null, defaultContent: "" },
       ],
       order: [[1, "desc"]],
       paging: true,
@@ -1,5 +1,7 @@
-from functools import wraps
+from functools import lru_cache, wraps
 from django.core.exceptions import PermissionDenied
+from django.db.models import Case, DecimalField, F, Q, Value, When
+from django.db.models.functions import Abs
 from django.utils import timezone
 from decimal import Decimal
 
@@ -28,35 +30,94 @@ def format_phone(phone):
 
 # convert datetime to local timezone and format it
 def conv_timezone(dt, dt_format):
+    return _conv_timezone_cached(dt, dt_format, timezone.get_current_timezone_name())
+
+
+# Cached per active timezone, since the same timestamps repeat across DataTables pages
+@lru_cache(maxsize=4096)
+def _conv_timezone_cached(dt, dt_format, tz_name):
     dtime = timezone.localtime(dt)
     return dtime.strftime(dt_format)
 
 
+# Format a calendar date; expense dates repeat across rows, so strings are cached per date
+@lru_cache(maxsize=4096)
+def format_date(value, dt_format='%d-%b-%Y'):
+    return value.strftime(dt_format)
+
+
 # Filter items based on table columns
 def filter_items(column_field, column_search, item, filter_type):
-    column_value = str(item.get(column_field, '')).lower()
+    return item_filter(column_field, column_search, filter_type)(item)
+
+
+# Build the row predicate behind filter_items once per column filter, so the search
+# term is lowered and any numeric bound parsed once rather than for every row
+def item_filter(column_field, column_search, filter_type):
     column_search_lower = column_search.lower()
 
+    def column_value(item):
+        return str(item.get(column_field, '')).lower()
+
     if filter_type == 'exact':
-        return column_search_lower == column_value
-    
-    elif filter_type == 'numeric':
-        try:
-            item_value = float(column_value) if column_value else 0.0
-            if column_search.startswith('-') and column_search[1:].replace(',', '').isdigit():
-                max_value = float(column_search[1:].replace(',', ''))
+        def exact_match(item):
+            return column_search_lower == column_value(item)
+        return exact_match
+
+    if filter_type != 'numeric':
+        def contains(item):
+            return column_search_lower in column_value(item)
+        return contains
+
+    try:
+        if column_search.startswith('-') and column_search[1:].replace(',', '').isdigit():
+            max_value = float(column_search[1:].replace(',', ''))
+            def matches(item_value, value):
                 return item_value <= max_value
-            elif column_search.endswith('-') and column_search[:-1].replace(',', '').isdigit():
-                min_value = float(column_search[:-1].replace(',', ''))
+        elif column_search.endswith('-') and column_search[:-1].replace(',', '').isdigit():
+            min_value = float(column_search[:-1].replace(',', ''))
+            def matches(item_value, value):
                 return item_value >= min_value
-            elif column_search.replace(',', '').replace('.', '', 1).isdigit(): # Allow floats like "123.45"
-                target_value = float(column_search.replace(',', ''))
+        elif column_search.replace(',', '').replace('.', '', 1).isdigit(): # Allow floats like "123.45"
+            target_value = float(column_search.replace(',', ''))
+            def matches(item_value, value):
                 return item_value == target_value
+        else:
+            def matches(item_value, value):
+                return column_search_lower in value
+    except ValueError:
+        def no_match(item):
+            return False
+        return no_match
+
+    def numeric_match(item):
+        value = column_value(item)
+        try:
+            item_value = float(value) if value else 0.0
         except ValueError:
             return False
-    return column_search_lower in column_value
+        return matches(item_value, value)
+    return numeric_match
+
 
+# Build the database-side equivalent of filter_items for a queryset lookup
+def filter_query(column_field, column_search, filter_type):
+    if filter_type == 'exact':
+        return Q(**{f'{column_field}__iexact': column_search})
 
+    elif filter_type == 'numeric':
+        search_value = column_search.replace(',', '')
+        if column_search.startswith('-') and search_value[1:].isdigit():
+            return Q(**{f'{column_field}__lte': Decimal(search_value[1:])})
+        elif column_search.endswith('-') and search_value[:-1].isdigit():
+            return Q(**{f'{column_field}__gte': Decimal(search_value[:-1])})
+        elif search_value.replace('.', '', 1).isdigit():
+            return Q(**{column_field: Decimal(search_value)})
+    return Q(**{f'{column_field}__icontains': column_search})
+
+
+# Amounts cluster heavily (1000, 5000, ...), so formatted strings are cached per value
+@lru_cache(maxsize=8192)
 def format_number(value):
     value = Decimal(value)
     if value == value.to_integral():
@@ -67,39 +128,79 @@ def format_number(value):
         return f"{value:.2f}".rstrip('0').rstrip('.')
     
 
-# selcomPay profit calculation per transaction
+# selcomPay charges per inclusive amount range
+SELCOM_CHARGE_RANGES = {
+    (1000, 4999): 400,
+    (5000, 9999): 800,
+    (10000, 19999): 1000,
+    (20000, 39999): 1500,
+    (40000, 49999): 2000,
+    (50000, 99999): 2500,
+    (100000, 199999): 3300,
+    (200000, 299999): 4500
+}
+
+# Lipanamba charges per inclusive amount range
+LIPA_CHARGE_RANGES = {
+    (1000, 4999): 300,
+    (5000, 19999): 500,
+    (20000, 49999): 800,
+    (50000, 99999): 1000,
+    (100000, 199999): 1500,
+    (200000, 299999): 2000,
+    (300000, 1000000): 2500
+}
+
+SELCOM_PROFIT_RATE = Decimal('0.013')
+
+
+# selcomPay profit calculation per transaction (Decimal, matching selcom_profit_expression)
 def selcom_profit(amount):
-    amount = float(amount)
-    charge_ranges = {
-        (1000, 4999): 400,
-        (5000, 9999): 800,
-        (10000, 19999): 1000,
-        (20000, 39999): 1500,
-        (40000, 49999): 2000,
-        (50000, 99999): 2500,
-        (100000, 199999): 3300,
-        (200000, 299999): 4500
-    }
-    for charge_range, charge_value in charge_ranges.items():
+    amount = Decimal(amount)
+    for charge_range, charge_value in SELCOM_CHARGE_RANGES.items():
         lower_limit, upper_limit = charge_range
         if lower_limit <= amount <= upper_limit:
-            return abs((amount * 0.013) - charge_value)
-    return 0.0
+            return abs((amount * SELCOM_PROFIT_RATE) - charge_value)
+    return Decimal('0')
 
-# Lipanamba profit calculation per transaction
+# Lipanamba profit calculation per transaction (Decimal, matching lipa_profit_expression)
 def lipa_profit(amount):
-    amount = float(amount)
-    charge_ranges = {
-        (1000, 4999): 300,
-        (5000, 19999): 500,
-        (20000, 49999): 800,
-        (50000, 99999): 1000,
-        (100000, 199999): 1500,
-        (200000, 299999): 2000,
-        (300000, 1000000): 2500
-    }
-    for charge_range, charge_value in charge_ranges.items():
+    amount = Decimal(amount)
+    for charge_range, charge_value in LIPA_CHARGE_RANGES.items():
         lower_limit, upper_limit = charge_range
         if lower_limit <= amount <= upper_limit:
-            return charge_value
-    return 0.0
+            return Decimal(charge_value)
+    return Decimal('0')
+
+
+# Database-side equivalent of selcom_profit for queryset annotations; the Case tree is
+# built once per field, since resolving it for a query copies rather than mutates it
+@lru_cache(maxsize=None)
+def selcom_profit_expression(field='amount'):
+    return Case(
+        *[
+            When(
+                **{f'{field}__gte': lower_limit, f'{field}__lte': upper_limit},
+                then=Abs(F(field) * Value(SELCOM_PROFIT_RATE) - Value(Decimal(charge_value)))
+            )
+            for (lower_limit, upper_limit), charge_value in SELCOM_CHARGE_RANGES.items()
+        ],
+        default=Value(Decimal('0')),
+        output_field=DecimalField(max_digits=15, decimal_places=5)
+    )
+
+
+# Database-side equivalent of lipa_profit for queryset annotations, built once per field
+@lru_cache(maxsize=None)
+def lipa_profit_expression(field='amount'):
+    return Case(
+        *[
+            When(
+                **{f'{field}__gte': lower_limit, f'{field}__lte': upper_limit},
+                then=Value(Decimal(charge_value))
+            )
+            for (lower_limit, upper_limit), charge_value in LIPA_CHARGE_RANGES.items()
+        ],
+        default=Value(Decimal('0')),
+        output_field=DecimalField(max_digits=15, decimal_places=5)
+    )